@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import os
+import re
 import json
-import glob
+import array
+import bisect
+import heapq
+import itertools
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _loads = json.loads
+
 
 @dataclass
 class ContinuitySnapshot:
@@ -17,7 +28,69 @@ class ContinuitySnapshot:
     recent_arc: str
     dominant_trend: str
     session_count: int
-    
+
+
+_SENTINEL = object()
+
+# Small integer ids for arc emotions, so counts live in a flat array.
+# Emotions outside this table get per-engine ids on first sight.
+_EMO_NAMES = (
+    "neutral", "happy", "nostalgic", "sad", "fear",
+    "angry", "excited", "tired", "bored",
+)
+_EMO_ID: Dict[str, int] = {name: i for i, name in enumerate(_EMO_NAMES)}
+
+
+# English descriptions per emotion (recent arc)
+_EMOTION_DESCRIPTIONS = {
+    "happy": "mostly bright and uplifting",
+    "nostalgic": "soft and reflective",
+    "sad": "a bit heavy and quiet",
+    "fear": "tense and cautious",
+    "angry": "sharp and unsettled",
+    "excited": "energetic and lively",
+    "tired": "slow and drained",
+    "bored": "flat and uneventful",
+}
+
+# Every keyword the CCE/DDE/TEE handlers react to, matched in one pass.
+# The lookahead lets overlapping keywords all be reported.
+_TRIGGER_RE = re.compile(r"(?=(eating|order|buy|get|minutes))")
+
+# Whitespace-delimited "eating" token and the token that follows it
+_EATING_OBJ_RE = re.compile(r"(?:^|\s)eating\s+(\S+)")
+
+
+def _parse_ymd(name: str) -> Optional[datetime.date]:
+    """Parse a 'YYYY-MM-DD.json' basename into a date (None if malformed)."""
+    base, _ = os.path.splitext(name)
+    if len(base) != 10 or base[4] != "-" or base[7] != "-":
+        return None
+    try:
+        return datetime.date(int(base[0:4]), int(base[5:7]), int(base[8:10]))
+    except ValueError:
+        return None
+
+
+def _decode_entries(raw: bytes) -> List[Dict[str, Any]]:
+    """Decode one session file's bytes (may contain list or single dict)."""
+    data = _loads(raw)
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict):
+        return [data]
+    return []
+
+
+def _read_session_file(path: str):
+    """Return (stat, raw bytes) for a session file, or None if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return os.fstat(f.fileno()), f.read()
+    except OSError:
+        return None
+
+
 # ------------------------------------------------------------
 # NEW: Contextual Continuity (CCE)
 # ------------------------------------------------------------
@@ -70,11 +143,26 @@ class ContinuityEngine:
         # NEW consolidation subsystems
         self.cstate = ContinuityState()
         self.intent_state: List[UserIntent] = []
-        self.expectations: List[TimedExpectation] = []
+        # min-heap of (deadline, seq, expectation); seq breaks deadline ties
+        self.expectations: List[tuple[float, int, TimedExpectation]] = []
+        self._expectation_seq = itertools.count()
 
         # internal turn counter for CCE
         self.turn_counter = 0
 
+        # one-shot DDE / TEE hints, consumed by build_*_context
+        self.last_dissonance: Optional[str] = None
+        self.last_reminder: Optional[str] = None
+
+        # session file caches (invalidated by directory / file mtime)
+        self._files_cache: Optional[tuple[int, List[str], List[str]]] = None
+        self._entry_cache: Dict[str, tuple[int, int, List[Dict[str, Any]], Optional[tuple]]] = {}
+        self._date_cache: Dict[str, Optional[datetime.date]] = {}
+
+        # Ids past the fixed _EMO_NAMES table, for unexpected emotions on disk
+        self._extra_emo_names: List[str] = []
+        self._extra_emo_id: Dict[str, int] = {}
+
 
     # ------------------------------------------------------------
     # COMPATIBILITY LAYER (Phase 9 API expected by nova.py)
@@ -82,36 +170,35 @@ class ContinuityEngine:
     def on_user_message(self, text: str):
         self.turn_counter += 1
 
+        # Lowercase and keyword-scan once; all three handlers share the result
+        lowered = text.lower()
+        hits = set(_TRIGGER_RE.findall(lowered))
+
         # Contextual Continuity update
-        self._update_cce(text)
+        self._update_cce(lowered, hits)
 
         # Dissonance Detection update
-        self._update_dde(text)
+        self._update_dde(lowered, hits)
 
         # Timed Expectation update (just log expectations; checking happens elsewhere)
-        self._update_tee(text)
+        self._update_tee(lowered, hits)
         
     # ------------------------------------------------------------
     # CCE — Contextual Continuity Engine
     # ------------------------------------------------------------
-    def _update_cce(self, text: str):
+    def _update_cce(self, lowered: str, hits: set):
         """
         Detect ongoing user activities and update continuity_state.
+        Expects the already-lowercased user message.
         """
-        lowered = text.lower()
-
         # Simple heuristic activity detection
         # Expand as needed later
-        if "eating" in lowered:
+        if "eating" in hits:
             self.cstate.activity = "eating"
-            # Extract object
-            words = lowered.split()
-            try:
-                idx = words.index("eating")
-                if idx + 1 < len(words):
-                    self.cstate.obj = words[idx + 1]
-            except ValueError:
-                pass
+            # Extract object (the word right after "eating")
+            m = _EATING_OBJ_RE.search(lowered)
+            if m:
+                self.cstate.obj = m.group(1)
 
             self.cstate.start_turn = self.turn_counter
             self.cstate.last_mentioned = self.turn_counter
@@ -142,14 +229,12 @@ class ContinuityEngine:
     # ------------------------------------------------------------
     # DDE — Dissonance Detection Engine
     # ------------------------------------------------------------
-    def _update_dde(self, text: str):
-        lowered = text.lower()
-
+    def _update_dde(self, lowered: str, hits: set):
         # Detect intent declarations
-        if "order" in lowered or "buy" in lowered or "get" in lowered:
+        if "order" in hits or "buy" in hits or "get" in hits:
             # naive extraction example:
             # "I'm ordering chinese" → category food_order, expected chinese
-            if "order" in lowered:
+            if "order" in hits:
                 expected = lowered.replace("ordering", "").replace("order", "").strip()
                 self.intent_state.append(
                     UserIntent("food_order", expected, self.turn_counter)
@@ -173,45 +258,51 @@ class ContinuityEngine:
         """
         Return dissonance hint ONLY when needed.
         """
-        if hasattr(self, "last_dissonance"):
-            msg = self.last_dissonance
-            del self.last_dissonance
-            return msg
-        return ""
+        msg = self.last_dissonance
+        if msg is None:
+            return ""
+        self.last_dissonance = None
+        return msg
 
     # ------------------------------------------------------------
     # TEE — Timed Expectation Engine
     # ------------------------------------------------------------
-    def _update_tee(self, text: str):
-        lowered = text.lower()
-
+    def _update_tee(self, lowered: str, hits: set):
         # Detect time-based user statements:
         # "I can only play 50 minutes"
-        if "minutes" in lowered:
+        if "minutes" in hits:
             try:
                 parts = lowered.split()
                 mins = int(parts[parts.index("minutes") - 1])
                 deadline = datetime.datetime.now().timestamp() + (mins * 60)
-                self.expectations.append(
-                    TimedExpectation(plan="leave or cook", deadline=deadline)
+                heapq.heappush(
+                    self.expectations,
+                    (
+                        deadline,
+                        next(self._expectation_seq),
+                        TimedExpectation(plan="leave or cook", deadline=deadline),
+                    ),
                 )
             except Exception:
                 pass
 
     def check_timed_expectations(self):
         now = datetime.datetime.now().timestamp()
-        for exp in self.expectations:
-            if not exp.reminded and now > exp.deadline:
+        # Only the earliest deadlines can have expired; stop at the first
+        # one still in the future.
+        while self.expectations and self.expectations[0][0] < now:
+            _, _, exp = heapq.heappop(self.expectations)
+            if not exp.reminded:
                 exp.reminded = True
                 self.last_reminder = "Didn't you need to cook or leave?"
                 return
 
     def build_tee_context(self) -> str:
-        if hasattr(self, "last_reminder"):
-            msg = self.last_reminder
-            del self.last_reminder
-            return msg
-        return ""
+        msg = self.last_reminder
+        if msg is None:
+            return ""
+        self.last_reminder = None
+        return msg
 
 
     def on_nova_message(self, text: str):
@@ -236,26 +327,120 @@ class ContinuityEngine:
     # Internal Helpers
     # ------------------------------------------------------------
 
-    def _load_session_files(self) -> List[str]:
-        """Return sorted list of session file paths (oldest → newest)."""
-        pattern = os.path.join(self.sessions_dir, "*.json")
-        files = glob.glob(pattern)
-        files.sort()
-        return files
+    def _load_session_files(self) -> tuple[List[str], List[str]]:
+        """
+        Return sorted session file paths (oldest → newest) and their
+        parallel basenames (for bisecting by ISO date).
+        Cached until the sessions directory's mtime changes.
+        """
+        try:
+            mtime_ns = os.stat(self.sessions_dir).st_mtime_ns
+        except OSError:
+            self._files_cache = None
+            return [], []
+
+        cached = self._files_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        try:
+            with os.scandir(self.sessions_dir) as it:
+                found = sorted(
+                    (e.name, e.path)
+                    for e in it
+                    if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+                )
+        except OSError:
+            self._files_cache = None
+            return [], []
+
+        names = [name for name, _ in found]
+        files = [path for _, path in found]
+        self._files_cache = (mtime_ns, files, names)
+        return files, names
 
     def _load_entries(self, path: str) -> List[Dict[str, Any]]:
-        """Load one session file (may contain list or single dict)."""
+        """
+        Load one session file (may contain list or single dict).
+        Parsed entries are reused while the file's (mtime, size) is unchanged.
+        """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
+            st = os.stat(path)
+        except OSError:
+            self._entry_cache.pop(path, None)
             return []
 
-        if isinstance(data, list):
-            return data
-        elif isinstance(data, dict):
-            return [data]
-        return []
+        cached = self._entry_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        try:
+            with open(path, "rb") as f:
+                entries = _decode_entries(f.read())
+        except Exception:
+            entries = []
+
+        self._entry_cache[path] = (st.st_mtime_ns, st.st_size, entries, None)
+        return entries
+
+    def _prefetch_entries(self, paths: List[str]) -> None:
+        """
+        Cold-start helper: read never-seen session files concurrently
+        (file reads release the GIL), then parse them on this thread.
+        Fewer than two cold files are left to the plain _load_entries path.
+        """
+        cold = [p for p in paths if p not in self._entry_cache]
+        if len(cold) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(cold))) as pool:
+            results = list(pool.map(_read_session_file, cold))
+
+        for path, result in zip(cold, results):
+            if result is None:
+                continue
+            st, raw = result
+            try:
+                entries = _decode_entries(raw)
+            except Exception:
+                entries = []  # cached too, so a bad file waits for a change
+            self._entry_cache[path] = (st.st_mtime_ns, st.st_size, entries, None)
+
+    def _load_arc_totals(self, path: str) -> tuple[tuple[tuple[int, float], ...], int]:
+        """
+        Per-file (emotion_id, total_weight) pairs plus the entry count.
+        Aggregated once per parsed file version, so repeated arc builds
+        only add a handful of per-file totals instead of walking entries.
+        """
+        entries = self._load_entries(path)
+        cached = self._entry_cache.get(path)
+        if cached is not None and cached[2] is entries and cached[3] is not None:
+            return cached[3]
+
+        totals: Dict[int, float] = {}
+        for e in entries:
+            dom = (e.get("dominant_emotion") or "neutral") or "neutral"
+            weight = float(e.get("overall_weight", 1.0))
+            i = _EMO_ID.get(dom)
+            if i is None:
+                i = self._emotion_id(dom)
+            totals[i] = totals.get(i, 0.0) + weight
+
+        result = (tuple(totals.items()), len(entries))
+        if cached is not None and cached[2] is entries:
+            self._entry_cache[path] = (cached[0], cached[1], entries, result)
+        return result
+
+    def _emotion_id(self, name: str) -> int:
+        """Id for an emotion outside _EMO_NAMES, assigned on first sight."""
+        i = self._extra_emo_id.get(name)
+        if i is None:
+            i = self._extra_emo_id[name] = len(_EMO_NAMES) + len(self._extra_emo_names)
+            self._extra_emo_names.append(name)
+        return i
+
+    def _emotion_name(self, i: int) -> str:
+        return _EMO_NAMES[i] if i < len(_EMO_NAMES) else self._extra_emo_names[i - len(_EMO_NAMES)]
 
     def _parse_date_from_filename(self, path: str) -> Optional[datetime.date]:
         """
@@ -263,43 +448,79 @@ class ContinuityEngine:
         Returns a date or None if parsing fails.
         """
         name = os.path.basename(path)
-        base, _ = os.path.splitext(name)
-        try:
-            return datetime.datetime.strptime(base, "%Y-%m-%d").date()
-        except Exception:
-            return None
-
-    # ------------------------------------------------------------
-    # PUBLIC CONTINUITY API
-    # ------------------------------------------------------------
+        d = self._date_cache.get(name, _SENTINEL)
+        if d is _SENTINEL:
+            d = _parse_ymd(name)
+            self._date_cache[name] = d
+        return d
 
-    def get_yesterday_summary(self) -> str:
+    def _scan(self, max_days: int = 7) -> Optional[tuple[List[str], List[Dict[str, Any]], array.array, int]]:
         """
-        Returns a clean summary of what 'yesterday' felt like.
-        If no sessions exist, or no entry for yesterday exists,
-        fallback language is used.
+        Walk the session files once and collect everything the
+        continuity views need:
+          - yesterday_summaries: summaries from yesterday's session(s)
+          - latest_entries: newest session's entries (fallback for yesterday)
+          - emotion_counts: weighted dominant emotions within max_days,
+            indexed by emotion id (see _EMO_ID / _emotion_id)
+          - session_count: number of entries considered for the arc
+        Returns None when no session files exist.
         """
-        files = self._load_session_files()
+        files, names = self._load_session_files()
         if not files:
-            return "Nova doesn't remember any previous days yet."
+            return None
 
         today = datetime.date.today()
         yesterday = today - datetime.timedelta(days=1)
+        earliest = today - datetime.timedelta(days=max_days)
 
         summaries: List[str] = []
-        for path in files:
+        emotion_counts = array.array("d", [0.0] * len(_EMO_NAMES))
+        session_count = 0
+
+        # Filenames are ISO dates, so everything older than the window
+        # can be skipped without parsing or opening it.
+        lo = bisect.bisect_left(names, min(earliest, yesterday).isoformat())
+
+        window = []
+        for path in files[lo:]:
             d = self._parse_date_from_filename(path)
-            if d != yesterday:
+            if d is None:
                 continue
-            for entry in self._load_entries(path):
-                text = (entry.get("summary") or "").strip()
-                if text:
-                    summaries.append(text)
+
+            is_yesterday = d == yesterday
+            in_arc = d >= earliest
+            if is_yesterday or in_arc:
+                window.append((path, is_yesterday, in_arc))
+
+        self._prefetch_entries([path for path, _, _ in window])
+
+        for path, is_yesterday, in_arc in window:
+            if is_yesterday:
+                for e in self._load_entries(path):
+                    text = (e.get("summary") or "").strip()
+                    if text:
+                        summaries.append(text)
+
+            if in_arc:
+                totals, count = self._load_arc_totals(path)
+                for i, weight in totals:
+                    if i >= len(emotion_counts):
+                        emotion_counts.extend([0.0] * (i + 1 - len(emotion_counts)))
+                    emotion_counts[i] += weight
+                session_count += count
+
+        latest_entries = [] if summaries else self._load_entries(files[-1])
+        return summaries, latest_entries, emotion_counts, session_count
+
+    @staticmethod
+    def _describe_yesterday(scan) -> str:
+        if scan is None:
+            return "Nova doesn't remember any previous days yet."
+
+        summaries, entries, _, _ = scan
 
         if not summaries:
             # Use latest session as fallback
-            latest_path = files[-1]
-            entries = self._load_entries(latest_path)
             if not entries:
                 return "Nova's sense of yesterday is still blank."
 
@@ -318,67 +539,21 @@ class ContinuityEngine:
             joined = " ".join(summaries)
             return f"Yesterday had multiple moments. Overall it felt like: {joined}"
 
-    def get_recent_arc(self, max_days: int = 7) -> tuple[str, str, int]:
-        """
-        Analyze several recent days and return:
-          - arc_text: a readable description of recent emotional pattern
-          - dominant: the dominant emotional trend
-          - session_count: number of sessions considered
-        """
-        files = self._load_session_files()
-        if not files:
+    def _describe_arc(self, scan) -> tuple[str, str, int]:
+        if scan is None:
             return ("Nova has no past days to look back on yet.", "neutral", 0)
 
-        today = datetime.date.today()
-        earliest = today - datetime.timedelta(days=max_days)
+        _, _, emotion_counts, session_count = scan
 
-        emotion_counts: Dict[str, float] = {}
-        session_count = 0
-
-        for path in files:
-            d = self._parse_date_from_filename(path)
-            if d is None or d < earliest:
-                continue
-
-            entries = self._load_entries(path)
-            if not entries:
-                continue
-
-            for e in entries:
-                dom = (e.get("dominant_emotion") or "neutral") or "neutral"
-                weight = float(e.get("overall_weight", 1.0))
-                emotion_counts[dom] = emotion_counts.get(dom, 0.0) + weight
-                session_count += 1
-
-        if not emotion_counts or session_count == 0:
+        if session_count == 0:
             return ("Recent days feel quiet and undefined so far.", "neutral", 0)
 
         # Determine dominant trend
-        dominant = max(emotion_counts.items(), key=lambda x: x[1])[0]
-
-        # English descriptions per emotion
-        def describe(em):
-            match em:
-                case "happy":
-                    return "mostly bright and uplifting"
-                case "nostalgic":
-                    return "soft and reflective"
-                case "sad":
-                    return "a bit heavy and quiet"
-                case "fear":
-                    return "tense and cautious"
-                case "angry":
-                    return "sharp and unsettled"
-                case "excited":
-                    return "energetic and lively"
-                case "tired":
-                    return "slow and drained"
-                case "bored":
-                    return "flat and uneventful"
-                case _:
-                    return "fairly steady and neutral"
-
-        description = describe(dominant)
+        dominant = self._emotion_name(
+            max(range(len(emotion_counts)), key=emotion_counts.__getitem__)
+        )
+
+        description = _EMOTION_DESCRIPTIONS.get(dominant, "fairly steady and neutral")
 
         arc_text = (
             f"Looking back over the last few days, things have felt {description}. "
@@ -387,12 +562,35 @@ class ContinuityEngine:
 
         return (arc_text, dominant, session_count)
 
+    # ------------------------------------------------------------
+    # PUBLIC CONTINUITY API
+    # ------------------------------------------------------------
+
+    def get_yesterday_summary(self) -> str:
+        """
+        Returns a clean summary of what 'yesterday' felt like.
+        If no sessions exist, or no entry for yesterday exists,
+        fallback language is used.
+        """
+        return self._describe_yesterday(self._scan())
+
+    def get_recent_arc(self, max_days: int = 7) -> tuple[str, str, int]:
+        """
+        Analyze several recent days and return:
+          - arc_text: a readable description of recent emotional pattern
+          - dominant: the dominant emotional trend
+          - session_count: number of sessions considered
+        """
+        return self._describe_arc(self._scan(max_days))
+
     def build_continuity_block(self, max_days: int = 7) -> str:
         """
         Build the text block that LlmBridge inserts into the full prompt.
+        Session files are walked once for both the yesterday and arc views.
         """
-        yesterday = self.get_yesterday_summary()
-        arc_text, dominant, count = self.get_recent_arc(max_days=max_days)
+        scan = self._scan(max_days)
+        yesterday = self._describe_yesterday(scan)
+        arc_text, dominant, count = self._describe_arc(scan)
 
         if count == 0:
             return (
@@ -1,20 +1,23 @@
 import json
 import os
+from collections import namedtuple
 from continuity_sys.identity.identity_state import IdentityState
 from continuity_sys.identity.relationship_state import RelationshipState
 
 # -----------------------------------------
 # DEFAULT RELATIONSHIP STAGE VALUES
 # -----------------------------------------
+_StageVals = namedtuple("_StageVals", "i we independence dependence level")
+
 STAGE_DEFAULTS = {
-    "enemy":        {"i": 1.0, "we": 0.0,  "independence": 1.0,  "dependence": 0.0,  "level": 0},
-    "frenemy":      {"i": 1.0, "we": 0.1,  "independence": 0.9,  "dependence": 0.0,  "level": 1},
-    "acquaintance": {"i": 1.0, "we": 0.05, "independence": 0.9,  "dependence": 0.05, "level": 2},
-    "friend":       {"i": 0.9, "we": 0.3,  "independence": 0.85, "dependence": 0.15, "level": 3},
-    "crush":        {"i": 0.8, "we": 0.5,  "independence": 0.7,  "dependence": 0.3,  "level": 4},
-    "lover":        {"i": 0.7, "we": 0.6,  "independence": 0.65, "dependence": 0.35, "level": 5},
-    "girlfriend":   {"i": 0.6, "we": 0.7,  "independence": 0.6,  "dependence": 0.4,  "level": 6},
-    "waifu":        {"i": 0.5, "we": 0.8,  "independence": 0.5,  "dependence": 0.5,  "level": 7}
+    "enemy":        _StageVals(i=1.0, we=0.0,  independence=1.0,  dependence=0.0,  level=0),
+    "frenemy":      _StageVals(i=1.0, we=0.1,  independence=0.9,  dependence=0.0,  level=1),
+    "acquaintance": _StageVals(i=1.0, we=0.05, independence=0.9,  dependence=0.05, level=2),
+    "friend":       _StageVals(i=0.9, we=0.3,  independence=0.85, dependence=0.15, level=3),
+    "crush":        _StageVals(i=0.8, we=0.5,  independence=0.7,  dependence=0.3,  level=4),
+    "lover":        _StageVals(i=0.7, we=0.6,  independence=0.65, dependence=0.35, level=5),
+    "girlfriend":   _StageVals(i=0.6, we=0.7,  independence=0.6,  dependence=0.4,  level=6),
+    "waifu":        _StageVals(i=0.5, we=0.8,  independence=0.5,  dependence=0.5,  level=7),
 }
 
 
@@ -26,6 +29,10 @@ class IdentityEngine:
         base_dir = os.path.dirname(__file__)
         self.json_path = os.path.join(base_dir, json_path)
         self.identity_data = self._load_identity_file()
+        self._timeline_text = self._format_timeline(self.identity_data)
+
+        # Rendered identity blocks keyed by relationship sliders
+        self._identity_block_cache: dict[tuple, str] = {}
 
         # Relationship state sliders
         self.state = IdentityState(default_stage)
@@ -55,18 +62,29 @@ class IdentityEngine:
             print("[Identity] Failed to load Nova JSON:", e)
             return {}
 
+    @staticmethod
+    def _format_timeline(data) -> dict:
+        """Pretty-print the life timeline blocks once; identity data never changes at runtime."""
+        tl = data.get("life_timeline", {}) if data else {}
+
+        def _fmt(block):
+            if isinstance(block, dict):
+                return json.dumps(block, indent=2, ensure_ascii=False)
+            return str(block)
+
+        return {key: _fmt(tl.get(key, "")) for key in ("0_5", "6_10", "11_13", "14_16")}
+
     # -----------------------------------------------------------
     # Apply Stage Values
     # -----------------------------------------------------------
     def _apply_stage_values(self, stage: str):
-        base = STAGE_DEFAULTS.get(stage, STAGE_DEFAULTS["acquaintance"])
-
-        self.state.stage = stage
-        self.state.identity_i = base["i"]
-        self.state.identity_we = base["we"]
-        self.state.independence = base["independence"]
-        self.state.dependence = base["dependence"]
-        self.state.level = base["level"]  # <-- FIXED
+        state = self.state
+        state.stage = stage
+        (state.identity_i,
+         state.identity_we,
+         state.independence,
+         state.dependence,
+         state.level) = STAGE_DEFAULTS.get(stage, STAGE_DEFAULTS["acquaintance"])
 
     # -----------------------------------------------------------
     # Setter
@@ -74,6 +92,7 @@ class IdentityEngine:
     def set_stage(self, stage: str):
         if stage in STAGE_DEFAULTS:
             self._apply_stage_values(stage)
+            self._identity_block_cache.clear()
 
     # -----------------------------------------------------------
     # Relationship gating
@@ -98,19 +117,19 @@ class IdentityEngine:
         if not data:
             return "Identity: (no identity data loaded)\n"
 
+        st = self.state
+        key = (st.stage, st.identity_i, st.identity_we, st.independence, st.dependence)
+        cached = self._identity_block_cache.get(key)
+        if cached is not None:
+            return cached
+
         name = data.get("name", "Nova")
         birthplace = data.get("heritage", {}).get("birthplace", "Unknown")
 
         mother = data.get("heritage", {}).get("parents", {}).get("mother", {}).get("name", "Unknown")
         father = data.get("heritage", {}).get("parents", {}).get("father", {}).get("name", "Unknown")
 
-        tl = data.get("life_timeline", {})
-
-        import json
-        def _fmt(block):
-            if isinstance(block, dict):
-                return json.dumps(block, indent=2, ensure_ascii=False)
-            return str(block)
+        tl = self._timeline_text
 
         # No indentation, no cut lines, closed string
         identity_text = (
@@ -120,10 +139,10 @@ class IdentityEngine:
     f"- Mother: {mother}\n"
     f"- Father: {father}\n\n"
     f"Early Life:\n"
-    f"- Ages 0–5:\n{_fmt(tl.get('0_5', ''))}\n\n"
-    f"- Ages 6–10:\n{_fmt(tl.get('6_10', ''))}\n\n"
-    f"- Ages 11–13:\n{_fmt(tl.get('11_13', ''))}\n\n"
-    f"- Ages 14–16:\n{_fmt(tl.get('14_16', ''))}\n\n"
+    f"- Ages 0–5:\n{tl['0_5']}\n\n"
+    f"- Ages 6–10:\n{tl['6_10']}\n\n"
+    f"- Ages 11–13:\n{tl['11_13']}\n\n"
+    f"- Ages 14–16:\n{tl['14_16']}\n\n"
     f"Relationship Model:\n"
     f"- Stage: {self.state.stage}\n"
     f"- I-level: {self.state.identity_i}\n"
@@ -132,4 +151,5 @@ class IdentityEngine:
     f"- Dependence: {self.state.dependence}\n"
             )
 
-        return identity_text
\ No newline at end of file
+        self._identity_block_cache[key] = identity_text
+        return identity_text
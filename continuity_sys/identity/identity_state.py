@@ -8,8 +8,11 @@ class IdentityState:
     identity_we: strength of "We" identity (0–1)
     independence: how self-contained she feels
     dependence: how emotionally invested she is
+    level: numeric stage level used for identity gating
     """
 
+    __slots__ = ("stage", "identity_i", "identity_we", "independence", "dependence", "level")
+
     def __init__(self, stage: str = "acquaintance"):
         self.stage = stage
 
@@ -18,3 +21,4 @@ class IdentityState:
         self.identity_we = 0.0
         self.independence = 0.90
         self.dependence = 0.05
+        self.level = 2
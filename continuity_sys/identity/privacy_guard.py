@@ -1,30 +1,138 @@
 # Identity/privacy_guard.py
 
 from __future__ import annotations
-from dataclasses import dataclass, field
 from typing import Optional
+import re
 import time
 
 
-@dataclass
+# Phrases that look like prying into what someone else shared
+_PROBE_TRIGGERS = (
+    "what did she say",
+    "what did he say",
+    "what did they say",
+    "tell me what she said",
+    "tell me what he said",
+    "tell me what they said",
+    "what can you tell me about what she said",
+    "what can you tell me about what he said",
+    "did someone tell you",
+    "did anybody tell you",
+    "what did you talk about with",
+    "what did you two talk about",
+)
+
+# Each list compiled once per process into a single alternation: one scan per turn
+_PROBE_RE = re.compile("|".join(map(re.escape, _PROBE_TRIGGERS)))
+
+# Apologies / promises to back off (straight or curly apostrophes, or none)
+_APOLOGY_RE = re.compile(r"sorry|\bi\s*won['’]?t pry|\bi['’]ll stop|\bi will stop")
+
+# Who the probe is about, as whole words ("the", "here" are not "he")
+_TOPIC_RE = re.compile(r"\b(s?he)\b")
+
+
+# PrivacyState packs its counters and flags into one int:
+#   bits 0-7    consecutive_attempts (saturates at 255)
+#   bits 8-23   total_attempts (saturates at 65535)
+#   bit  24     hard_locked
+#   bit  25     recently_forgiven
+#   bits 26-31  last_topic_tag, as an index into _TOPIC_TAGS
+_CONSEC_MASK = 0xFF
+_TOTAL_SHIFT = 8
+_TOTAL_MASK = 0xFFFF << _TOTAL_SHIFT
+_LOCKED = 1 << 24
+_FORGIVEN = 1 << 25
+_TAG_SHIFT = 26
+_TAG_MASK = 0x3F << _TAG_SHIFT
+
+_TOPIC_TAGS = ("", "she", "he", "other")
+_TOPIC_ID = {tag: i for i, tag in enumerate(_TOPIC_TAGS)}
+
+
 class PrivacyState:
+    __slots__ = ("bits", "last_attempt_time")
+
+    def __init__(
+        self,
+        consecutive_attempts: int = 0,
+        total_attempts: int = 0,
+        hard_locked: bool = False,
+        last_attempt_time: float = 0.0,
+        last_topic_tag: str = "",
+        recently_forgiven: bool = False,
+    ):
+        self.bits = 0
+        self.consecutive_attempts = consecutive_attempts
+        self.total_attempts = total_attempts
+        self.hard_locked = hard_locked
+        self.last_topic_tag = last_topic_tag
+        self.recently_forgiven = recently_forgiven
+
+        # Last time a privacy probe happened (for decay)
+        self.last_attempt_time = last_attempt_time
+
     # How many times in a row the user pushed on a private topic
-    consecutive_attempts: int = 0
+    @property
+    def consecutive_attempts(self) -> int:
+        return self.bits & _CONSEC_MASK
+
+    @consecutive_attempts.setter
+    def consecutive_attempts(self, value: int) -> None:
+        value = 0 if value < 0 else (_CONSEC_MASK if value > _CONSEC_MASK else value)
+        self.bits = (self.bits & ~_CONSEC_MASK) | value
 
     # Total number of pushes this session (used for hybrid behavior)
-    total_attempts: int = 0
+    @property
+    def total_attempts(self) -> int:
+        return (self.bits & _TOTAL_MASK) >> _TOTAL_SHIFT
+
+    @total_attempts.setter
+    def total_attempts(self, value: int) -> None:
+        value = 0 if value < 0 else (0xFFFF if value > 0xFFFF else value)
+        self.bits = (self.bits & ~_TOTAL_MASK) | (value << _TOTAL_SHIFT)
 
     # If True, Nova should stay silent on this topic until apology / subject change
-    hard_locked: bool = False
+    @property
+    def hard_locked(self) -> bool:
+        return bool(self.bits & _LOCKED)
+
+    @hard_locked.setter
+    def hard_locked(self, value: bool) -> None:
+        self.bits = self.bits | _LOCKED if value else self.bits & ~_LOCKED
 
-    # Last time a privacy probe happened (for decay)
-    last_attempt_time: float = 0.0
+    # Rough tag of what they were asking about ("she", "he", "other")
+    @property
+    def last_topic_tag(self) -> str:
+        return _TOPIC_TAGS[(self.bits & _TAG_MASK) >> _TAG_SHIFT]
 
-    # Rough tag of what they were asking about ("she", "friend", etc)
-    last_topic_tag: str = ""
+    @last_topic_tag.setter
+    def last_topic_tag(self, value: str) -> None:
+        tag_id = _TOPIC_ID.get(value, _TOPIC_ID["other"])
+        self.bits = (self.bits & ~_TAG_MASK) | (tag_id << _TAG_SHIFT)
 
     # Whether user has recently apologized / backed off
-    recently_forgiven: bool = False
+    @property
+    def recently_forgiven(self) -> bool:
+        return bool(self.bits & _FORGIVEN)
+
+    @recently_forgiven.setter
+    def recently_forgiven(self, value: bool) -> None:
+        self.bits = self.bits | _FORGIVEN if value else self.bits & ~_FORGIVEN
+
+    def __repr__(self) -> str:
+        return (
+            f"PrivacyState(consecutive_attempts={self.consecutive_attempts}, "
+            f"total_attempts={self.total_attempts}, hard_locked={self.hard_locked}, "
+            f"last_attempt_time={self.last_attempt_time}, "
+            f"last_topic_tag={self.last_topic_tag!r}, "
+            f"recently_forgiven={self.recently_forgiven})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PrivacyState):
+            return NotImplemented
+        return self.bits == other.bits and self.last_attempt_time == other.last_attempt_time
 
 
 class PrivacyGuard:
@@ -41,6 +149,10 @@ class PrivacyGuard:
     def __init__(self):
         self.state = PrivacyState()
 
+        # (normalized text, is_probe) from the last probe check; on_user_turn
+        # and maybe_block_request see the same message each turn
+        self._last_probe: Optional[tuple[str, bool]] = None
+
         # Phrases can later be emotion-aware; for now they’re neutral-soft
         self._soft_lines = [
             "Sorry, Yuch… I shouldn’t say. She was kind enough to share that with me, and I don’t want to break that.",
@@ -66,47 +178,57 @@ class PrivacyGuard:
     # ------------------------------------------------------
     # Public entry points
     # ------------------------------------------------------
-    def on_user_turn(self, user_text: str) -> None:
+    def on_user_turn(self, user_text: str, lowered: Optional[str] = None) -> None:
         """
         Called every user message so we can:
         - detect apologies
         - detect topic change
         - decay escalation a bit over time
+        `lowered` is the caller's user_text.strip().lower(), if already computed.
         """
-        lowered = user_text.strip().lower()
+        if lowered is None:
+            lowered = user_text.strip().lower()
 
         # If they apologize or promise to stop prying → reset lock
-        if any(word in lowered for word in ["sorry", "i won't pry", "i wont pry", "i’ll stop", "i will stop"]):
+        if _APOLOGY_RE.search(lowered):
             self._reset_after_apology()
             return
 
         # If this turn is not a privacy probe, we may reduce consecutive_attempts slowly
         if not self._looks_like_privacy_probe(lowered):
+            bits = self.state.bits
             # Topic changed: decay the streak
-            if self.state.consecutive_attempts > 0:
-                self.state.consecutive_attempts -= 1
-                if self.state.consecutive_attempts <= 0:
-                    self.state.consecutive_attempts = 0
+            if bits & _CONSEC_MASK:
+                bits -= 1
             # If they move on long enough, unlock hard lock too
-            if self.state.consecutive_attempts == 0:
-                self.state.hard_locked = False
+            if not bits & _CONSEC_MASK:
+                bits &= ~_LOCKED
+            self.state.bits = bits
             return
 
-    def maybe_block_request(self, user_text: str, emotion_primary: Optional[str] = None) -> Optional[str]:
+    def maybe_block_request(
+        self,
+        user_text: str,
+        emotion_primary: Optional[str] = None,
+        lowered: Optional[str] = None,
+    ) -> Optional[str]:
         """
         Called from LlmBridge BEFORE generating a normal reply.
         If this returns a string → send that instead of the usual reply.
         If it returns None -> safe, continue as normal.
+        `lowered` is the caller's user_text.strip().lower(), if already computed.
         """
-        text = user_text.strip().lower()
+        text = lowered if lowered is not None else user_text.strip().lower()
+
+        is_probe = self._looks_like_privacy_probe(text)
 
         # Already in hard lock on this topic → silence / ellipsis
-        if self.state.hard_locked and self._looks_like_privacy_probe(text):
+        if self.state.hard_locked and is_probe:
             # She refuses to talk until subject changes or apology happens
             return "..."
 
         # If this isn't a privacy probe, do nothing
-        if not self._looks_like_privacy_probe(text):
+        if not is_probe:
             return None
 
         # Register the attempt and decide how to answer
@@ -141,38 +263,33 @@ class PrivacyGuard:
         - asking what she was told by 'him/her/them'
         We'll refine later if needed.
         """
-        triggers = [
-            "what did she say",
-            "what did he say",
-            "what did they say",
-            "tell me what she said",
-            "tell me what he said",
-            "tell me what they said",
-            "what can you tell me about what she said",
-            "what can you tell me about what he said",
-            "did someone tell you",
-            "did anybody tell you",
-            "what did you talk about with",
-            "what did you two talk about",
-        ]
-        return any(t in text for t in triggers)
+        last = self._last_probe
+        if last is not None and last[0] == text:
+            return last[1]
+
+        result = _PROBE_RE.search(text) is not None
+        self._last_probe = (text, result)
+        return result
 
     def _register_attempt(self, text: str) -> None:
-        self.state.consecutive_attempts += 1
-        self.state.total_attempts += 1
-        self.state.last_attempt_time = time.time()
-        # rough topic tag
-        if "she" in text:
-            self.state.last_topic_tag = "she"
-        elif "he" in text:
-            self.state.last_topic_tag = "he"
+        bits = self.state.bits
+        if bits & _CONSEC_MASK != _CONSEC_MASK:
+            bits += 1
+        if bits & _TOTAL_MASK != _TOTAL_MASK:
+            bits += 1 << _TOTAL_SHIFT
+        # rough topic tag; "she" wins if both appear
+        tags = set(_TOPIC_RE.findall(text))
+        if "she" in tags:
+            tag = "she"
+        elif "he" in tags:
+            tag = "he"
         else:
-            self.state.last_topic_tag = "other"
+            tag = "other"
+        self.state.bits = (bits & ~_TAG_MASK) | (_TOPIC_ID[tag] << _TAG_SHIFT)
+        self.state.last_attempt_time = time.time()
 
     def _reset_after_apology(self) -> None:
-        self.state.consecutive_attempts = 0
-        self.state.hard_locked = False
-        self.state.recently_forgiven = True
+        self.state.bits = (self.state.bits & ~(_CONSEC_MASK | _LOCKED)) | _FORGIVEN
 
     # ------------------------------------------------------
     # Line pickers (later can be emotion-aware)
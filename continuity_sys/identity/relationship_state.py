@@ -1,3 +1,18 @@
+from types import MappingProxyType
+
+# Default values per stage: (identity_i, identity_we, independence, dependence)
+_STAGE_DEFAULTS = MappingProxyType({
+    "enemy":           (1.00, 0.00, 1.00, 0.00),
+    "frenemy":         (1.00, 0.00, 0.85, 0.00),
+    "acquaintance":    (1.00, 0.00, 0.85, 0.05),
+    "friend":          (0.90, 0.10, 0.85, 0.15),
+    "crush":           (0.80, 0.20, 0.70, 0.30),
+    "lover":           (0.70, 0.30, 0.65, 0.35),
+    "girlfriend":      (0.60, 0.40, 0.60, 0.40),
+    "waifu":           (0.50, 0.50, 0.50, 0.50),
+})
+
+
 class RelationshipState:
     """
     Represents Nova's relationship sliders:
@@ -11,20 +26,8 @@ class RelationshipState:
     def __init__(self, stage="acquaintance"):
         self.stage = stage
 
-        # Default values per stage
-        defaults = {
-            "enemy":            (1.00, 0.00, 1.00, 0.00),
-            "frenemy":         (1.00, 0.00, 0.85, 0.00),
-            "acquaintance":    (1.00, 0.00, 0.85, 0.05),
-            "friend":          (0.90, 0.10, 0.85, 0.15),
-            "crush":           (0.80, 0.20, 0.70, 0.30),
-            "lover":           (0.70, 0.30, 0.65, 0.35),
-            "girlfriend":      (0.60, 0.40, 0.60, 0.40),
-            "waifu":           (0.50, 0.50, 0.50, 0.50),
-        }
-
         # Apply defaults
         (self.identity_i,
          self.identity_we,
          self.independence,
-         self.dependence) = defaults.get(stage, defaults["acquaintance"])
+         self.dependence) = _STAGE_DEFAULTS.get(stage, _STAGE_DEFAULTS["acquaintance"])
@@ -15,6 +15,44 @@ class AffectionState:
     readiness: float = 0.0         # NSFW readiness 0–1
 
 
+def _affection_step(affection, arousal, comfort, fluster,
+                    trust, valence, intensity, stability, maturity):
+    """
+    Pure numeric affection update: scalars in, clamped 5-tuple out
+    (affection, arousal, comfort, fluster, readiness).
+    """
+    # 1. Emotional closeness grows with trust
+    affection += (trust - affection) * 0.05
+
+    # 2. Affection increases when mood is positive
+    if valence > 0.2:
+        affection += 0.02
+
+    # 3. Arousal rises with emotional intensity (but slowly)
+    if intensity > 0.4:
+        arousal += 0.015 * intensity
+
+    # 4. Comfort increases with calmness
+    if stability > 0.5:
+        comfort += 0.01
+
+    # 5. Fluster rises when affection high + maturity low
+    if affection > 0.55 and maturity < 0.5:
+        fluster += 0.02
+
+    # 6. NSFW readiness is blend of affection + arousal + comfort
+    readiness = affection * 0.4 + arousal * 0.4 + comfort * 0.2
+
+    # Clamp values (inline comparisons: no builtin calls on the hot path)
+    return (
+        0.0 if affection < 0.0 else (1.0 if affection > 1.0 else affection),
+        0.0 if arousal < 0.0 else (1.0 if arousal > 1.0 else arousal),
+        0.0 if comfort < 0.0 else (1.0 if comfort > 1.0 else comfort),
+        0.0 if fluster < 0.0 else (1.0 if fluster > 1.0 else fluster),
+        0.0 if readiness < 0.0 else (1.0 if readiness > 1.0 else readiness),
+    )
+
+
 class AffectionEngine:
     def __init__(self):
         self.state = AffectionState()
@@ -25,39 +63,20 @@ class AffectionEngine:
         This does NOT produce explicit output.
         It only affects behavior, tone, hesitation, and intent.
         """
+        st = self.state
+        emotion = nova_state.emotion
 
-        # 1. Emotional closeness grows with trust
-        t = nova_state.relationship.trust
-        self.state.affection += (t - self.state.affection) * 0.05
-
-        # 2. Affection increases when mood is positive
-        if nova_state.mood.valence > 0.2:
-            self.state.affection += 0.02
-
-        # 3. Arousal rises with emotional intensity (but slowly)
-        if nova_state.emotion.intensity > 0.4:
-            self.state.arousal += 0.015 * nova_state.emotion.intensity
-
-        # 4. Comfort increases with calmness
-        if nova_state.emotion.stability > 0.5:
-            self.state.comfort += 0.01
-
-        # 5. Fluster rises when affection high + maturity low
-        if self.state.affection > 0.55 and nova_state.maturity < 0.5:
-            self.state.fluster += 0.02
-
-        # 6. NSFW readiness is blend of affection + arousal + comfort
-        self.state.readiness = (
-            self.state.affection * 0.4 +
-            self.state.arousal * 0.4 +
-            self.state.comfort * 0.2
+        (st.affection,
+         st.arousal,
+         st.comfort,
+         st.fluster,
+         st.readiness) = _affection_step(
+            st.affection, st.arousal, st.comfort, st.fluster,
+            nova_state.relationship.trust,
+            nova_state.mood.valence,
+            emotion.intensity,
+            emotion.stability,
+            nova_state.maturity,
         )
 
-        # Clamp values
-        self.state.affection = min(max(self.state.affection, 0), 1)
-        self.state.arousal = min(max(self.state.arousal, 0), 1)
-        self.state.comfort = min(max(self.state.comfort, 0), 1)
-        self.state.fluster = min(max(self.state.fluster, 0), 1)
-        self.state.readiness = min(max(self.state.readiness, 0), 1)
-
-        return self.state
+        return st
@@ -15,7 +15,9 @@ And integrates smoothly with:
 """
 
 import random
-from typing import Any, Dict
+import re
+import time
+from typing import Any, Dict, Optional
 
 from nexus.amygdala.emotion.emotional_state import EmotionalState
 from nexus.amygdala.emotion import fusion_engine
@@ -37,6 +39,31 @@ EMOTION_KEYWORDS = {
     "neutral": []
 }
 
+# Secondary shades each primary/mood/baseline emotion brings along
+SECONDARY_MAP = {
+    "happy": ("curious", "excited"),
+    "nostalgic": ("sad", "warm"),
+    "curious": ("neutral", "hopeful"),
+    "afraid": ("alert", "cautious"),
+    "sad": ("nostalgic", "tired"),
+    "bored": ("blank", "restless"),
+    "excited": ("happy", "eager"),
+    "neutral": (),
+}
+
+# keyword → emotions it scores for
+_KW_EMOTIONS: Dict[str, tuple] = {}
+for _emotion, _keywords in EMOTION_KEYWORDS.items():
+    for _kw in _keywords:
+        _KW_EMOTIONS[_kw] = _KW_EMOTIONS.get(_kw, ()) + (_emotion,)
+
+# Stimulus is tokenized into lowercase words; keywords match whole words only
+_WORD_RE = re.compile(r"[a-z]+")
+
+# SECONDARY_MAP as frozensets so shades union without copying
+_EMPTY: frozenset = frozenset()
+_SECONDARY_FS: Dict[str, frozenset] = {k: frozenset(v) for k, v in SECONDARY_MAP.items()}
+
 
 # -----------------------------------------------------------------------------------
 # Load persistent emotional memory map
@@ -64,21 +91,31 @@ def is_avoided(map_data: Dict[str, Any], stimulus: str, threshold: int = -2) ->
 def update_emotional_state(
     state: EmotionalState,
     heard_text: str,
-    seen_text: str = ""
+    seen_text: str = "",
+    lowered: Optional[str] = None,
 ) -> EmotionalState:
     """
     Computes Nova's emotional reaction to new sensory/stimulus input.
     Updates EmotionalState accordingly.
+    `lowered` is heard_text.strip().lower() when the caller already has it.
     """
 
-    stimulus = f"{heard_text.strip().lower()} {seen_text.strip().lower()}".strip()
+    if lowered is None:
+        lowered = heard_text.strip().lower()
+    if seen_text:
+        stimulus = f"{lowered} {seen_text.strip().lower()}".strip()
+    else:
+        stimulus = lowered
+
+    # One timestamp for everything this update touches
+    now = time.time()
 
     # -------------------------
     # 1) Fear avoidance
     # -------------------------
     if is_avoided(emotion_map, stimulus):
         # Strong fear memory detected
-        state.push_emotion("afraid")
+        state.push_emotion("afraid", now=now)
         state.mood = "afraid"
         state.secondary = ["alert", "cautious"]
         return state
@@ -90,7 +127,7 @@ def update_emotional_state(
     if remembered:
         # Reinforce memory if same emotion reoccurs
         emotion_memory_map.update_emotion(
-            emotion_map, stimulus, remembered, reinforce=+1
+            emotion_map, stimulus, remembered, reinforce=+1, now=now
         )
         primary = remembered
     else:
@@ -98,9 +135,10 @@ def update_emotional_state(
         # 3) Keyword scoring
         # -------------------------
         scores = {e: 0 for e in EMOTION_KEYWORDS}
-        for emotion, keywords in EMOTION_KEYWORDS.items():
-            for word in keywords:
-                if word in stimulus:
+        for word in set(_WORD_RE.findall(stimulus)):
+            emotions = _KW_EMOTIONS.get(word)
+            if emotions is not None:
+                for emotion in emotions:
                     scores[emotion] += 1
 
         # add light continuity
@@ -114,13 +152,13 @@ def update_emotional_state(
 
         # Save first-time emotional association
         emotion_memory_map.update_emotion(
-            emotion_map, stimulus, primary, reinforce=0
+            emotion_map, stimulus, primary, reinforce=0, now=now
         )
 
     # -------------------------
     # 4) Update primary emotion
     # -------------------------
-    state.push_emotion(primary)
+    state.push_emotion(primary, now=now)
 
     # -------------------------
     # 5) Recompute mood
@@ -131,35 +169,21 @@ def update_emotional_state(
     # -------------------------
     # 6) Compute secondary shades
     # -------------------------
-    SECONDARY_MAP = {
-        "happy": ["curious", "excited"],
-        "nostalgic": ["sad", "warm"],
-        "curious": ["neutral", "hopeful"],
-        "afraid": ["alert", "cautious"],
-        "sad": ["nostalgic", "tired"],
-        "bored": ["blank", "restless"],
-        "excited": ["happy", "eager"],
-        "neutral": [],
-    }
-
-    combined = set()
-    combined.update(SECONDARY_MAP.get(primary, []))
-    combined.update(SECONDARY_MAP.get(state.mood, []))
-    combined.update(SECONDARY_MAP.get(state.baseline, []))
-
-    state.secondary = [e for e in combined if e not in (primary, state.mood)]
+    combined = (
+        _SECONDARY_FS.get(primary, _EMPTY)
+        | _SECONDARY_FS.get(state.mood, _EMPTY)
+        | _SECONDARY_FS.get(state.baseline, _EMPTY)
+    )
+
+    state.secondary = [e for e in combined if e != primary and e != state.mood]
 
     # -------------------------
     # 7) Layer X – fusion emotion
     # -------------------------
-    try:
-        # For now we don't pass explicit spikes; those can be added later
-        # (e.g. jealousy, embarrassment) by higher-level systems.
-        
-        fusion_engine.update_fusion(state, spikes=None)
-    except Exception:
-        # Fail-safe: fusion is purely cosmetic; never break core logic.
-        pass
+    # For now we don't pass explicit spikes; those can be added later
+    # (e.g. jealousy, embarrassment) by higher-level systems.
+    # Fusion is plain dict probing on string labels and cannot fail here.
+    fusion_engine.update_fusion(state, spikes=None, now=now)
 
     return state
 
@@ -167,8 +191,8 @@ class EmotionEngine:
     def __init__(self, state=None):
         self.state = state or EmotionalState()
 
-    def detect_user_emotion(self, text):
-        return update_emotional_state(self.state, text)
+    def detect_user_emotion(self, text, lowered=None):
+        return update_emotional_state(self.state, text, lowered=lowered)
 
     def update(self, emotional_input):
         self.state = emotional_input
@@ -2,26 +2,46 @@ import json
 import os
 import time
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 # Correct file path for your new architecture
 MAP_PATH = os.path.join("..", "Memory", "data", "emotion_memory_map.json")
 
 
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_map():
     """Load the emotional memory map from disk."""
     try:
         if not os.path.exists(MAP_PATH):
             return {}
-        with open(MAP_PATH, "r") as f:
-            return json.load(f)
+        with open(MAP_PATH, "rb") as f:
+            return _loads(f.read())
     except Exception:
         return {}  # fail-safe
 
 
 def save_map(memory_map):
-    """Save the emotional memory map to disk."""
+    """Atomically save a full snapshot of the emotional memory map."""
     os.makedirs(os.path.dirname(MAP_PATH), exist_ok=True)
-    with open(MAP_PATH, "w") as f:
-        json.dump(memory_map, f, indent=2)
+    # Write a sibling temp file and swap it in: a crash mid-write never
+    # leaves a truncated map behind.
+    tmp = MAP_PATH + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(memory_map))
+    else:
+        # Stream compact JSON through a large buffer instead of building one big string
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 16) as f:
+            json.dump(memory_map, f, separators=(",", ":"))
+    os.replace(tmp, MAP_PATH)
 
 
 def get_emotion(memory_map, stimulus):
@@ -32,22 +52,24 @@ def get_emotion(memory_map, stimulus):
     return None
 
 
-def update_emotion(memory_map, stimulus, new_emotion, reinforce=0):
+def update_emotion(memory_map, stimulus, new_emotion, reinforce=0, now=None):
     """
     Update or reinforce emotion for a stimulus.
     This version includes:
     - reinforcement score
     - count of occurrences
-    - last-seen timestamp
+    - last-seen timestamp (`now` if given, else the current time)
     """
     stimulus = stimulus.lower()
+    if now is None:
+        now = time.time()
 
     # Retrieve or create new entry
     entry = memory_map.get(stimulus, {
         "emotion": new_emotion,
         "reinforcement": 0,
         "count": 0,
-        "last_seen": time.time()
+        "last_seen": now
     })
 
     # Update reinforcement
@@ -57,7 +79,7 @@ def update_emotion(memory_map, stimulus, new_emotion, reinforce=0):
     entry["count"] += 1
 
     # Update timestamp
-    entry["last_seen"] = time.time()
+    entry["last_seen"] = now
 
     # Reinforcement logic
     if reinforce < 0 and entry["reinforcement"] <= -2:
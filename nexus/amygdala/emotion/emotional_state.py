@@ -16,11 +16,17 @@ Designed to be:
 - easy to extend later (intensity, fatigue, etc.)
 """
 
+from collections import deque
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Deque, Dict, Any, Optional
+import sys
 import time
 
 
+# How many recent primary emotions are kept for mood calculation
+MAX_HISTORY = 20
+
+
 @dataclass
 class EmotionalState:
     
@@ -28,7 +34,7 @@ class EmotionalState:
     mood: str = "neutral"
     primary: str = "neutral"
     secondary: List[str] = field(default_factory=list)
-    history: List[str] = field(default_factory=list)
+    history: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_HISTORY))
     last_update_ts: float = field(default_factory=time.time)
 
     # Layer X – emergent fusion emotion (e.g. "insecure", "mischievous")
@@ -37,26 +43,40 @@ class EmotionalState:
     # When fusion was last updated (for decay / drift)
     last_fusion_update: float = field(default_factory=time.time)
 
-
-    def push_emotion(self, emotion: Optional[str], max_history: int = 20) -> None:
+    def __post_init__(self) -> None:
+        # Accept plain lists (e.g. from callers / saved state) but keep a bounded deque
+        if not isinstance(self.history, deque):
+            self.history = deque(self.history, maxlen=MAX_HISTORY)
+
+    def push_emotion(
+        self,
+        emotion: Optional[str],
+        max_history: int = MAX_HISTORY,
+        now: Optional[float] = None,
+    ) -> None:
         """
         Register a new immediate emotion and update the history.
 
         This should be called by the emotion engine whenever a new
         emotion is computed from an event or user message.
+        `now` lets the caller share one timestamp across a whole update.
         """
         if not emotion:
             return
 
+        # Labels may come from JSON (memory map, saved state); interning
+        # makes every history entry share one str per label, so mood
+        # tallies hit dict slots by identity.
+        emotion = sys.intern(emotion)
+
         self.primary = emotion
-        self.history.append(emotion)
 
-        # keep history bounded for performance
-        if len(self.history) > max_history:
-            # drop the oldest
-            self.history = self.history[-max_history:]
+        # bounded deque: appending drops the oldest entry in O(1)
+        if self.history.maxlen != max_history:
+            self.history = deque(self.history, maxlen=max_history)
+        self.history.append(emotion)
 
-        self.last_update_ts = time.time()
+        self.last_update_ts = time.time() if now is None else now
 
     def set_baseline(self, new_baseline: str) -> None:
         """
@@ -81,6 +101,7 @@ class EmotionalState:
         """
         data = asdict(self)
         # ensure everything is JSON-friendly (floats/strings/lists are fine)
+        data["history"] = list(self.history)
         return data
 
     @classmethod
@@ -94,7 +115,7 @@ class EmotionalState:
             mood=data.get("mood", "neutral"),
             primary=data.get("primary", "neutral"),
             secondary=list(data.get("secondary", [])),
-            history=list(data.get("history", [])),
+            history=[sys.intern(e) for e in data.get("history", [])],
             last_update_ts=float(data.get("last_update_ts", time.time())),
             fusion=data.get("fusion"),  # optional, defaults to None
             last_fusion_update=float(data.get("last_fusion_update", time.time())),
@@ -19,6 +19,7 @@ Fusion emotions are:
 
 from __future__ import annotations
 
+import time
 from typing import List, Optional
 from nexus.amygdala.emotion.emotional_state import EmotionalState
 
@@ -111,32 +112,29 @@ def compute_fusion(
     if not p:
         return None
 
-    secondary_list = [s for s in (secondary_list or []) if s]  # filter empties
-    spikes = [s for s in (spikes or []) if s]
-
-    # Normalize all modifiers
-    sec_norm = [_normalize(s) for s in secondary_list if _normalize(s)]
-    spike_norm = [_normalize(s) for s in spikes if _normalize(s)]
-
-    # 1) Try spike-based fusion first (Layer 1 + Layer 3)
-    for sp in spike_norm:
-        key = (p, sp)
-        if key in FUSION_RULES:
-            return FUSION_RULES[key]
-
-    # 2) Then try secondary-based fusion (Layer 1 + Layer 2)
-    for sec in sec_norm:
-        key = (p, sec)
-        if key in FUSION_RULES:
-            return FUSION_RULES[key]
-
-    # 3) No fusion match
+    # Rule keys are already lowercase, so modifiers are normalized once
+    # and probed directly. Spikes are tried first (Layer 1 + Layer 3),
+    # then secondary shades (Layer 1 + Layer 2).
+    for source in (spikes or (), secondary_list or ()):
+        for s in source:
+            if not s:
+                continue
+            fusion = FUSION_RULES.get((p, s.strip().lower()))
+            if fusion is not None:
+                return fusion
+
+    # No fusion match
     return None
 
 
-def update_fusion(state: EmotionalState, spikes: List[str] | None = None) -> EmotionalState:
+def update_fusion(
+    state: EmotionalState,
+    spikes: List[str] | None = None,
+    now: float | None = None,
+) -> EmotionalState:
     """
     Compute and attach a fusion emotion to the EmotionalState.
+    `now` (optional) reuses the caller's timestamp for this turn.
     """
 
     fusion = compute_fusion(
@@ -148,11 +146,7 @@ def update_fusion(state: EmotionalState, spikes: List[str] | None = None) -> Emo
     state.fusion = fusion
 
     # Timestamp this fusion for decay, drift, and future logic
-    try:
-        import time
-        state.last_fusion_update = time.time()
-    except Exception:
-        pass
+    state.last_fusion_update = time.time() if now is None else now
 
     return state
 
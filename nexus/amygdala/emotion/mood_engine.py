@@ -7,7 +7,6 @@ based on recent primary emotions.
 Lightweight, stable, and game-safe.
 """
 
-from collections import Counter
 from typing import List
 
 
@@ -25,11 +24,20 @@ def calculate_mood(history: List[str]) -> str:
     if not history:
         return "neutral"
 
-    counts = Counter(history)
-    (emotion, amount) = counts.most_common(1)[0]
+    # History is short (≤20), so a plain dict tally beats Counter.most_common
+    counts = {}
+    for e in history:
+        counts[e] = counts.get(e, 0) + 1
+
+    # First-seen emotion wins ties, same as most_common
+    emotion, amount = "neutral", 0
+    for e, c in counts.items():
+        if c > amount:
+            emotion, amount = e, c
 
     # Prevent mood thrashing (must appear at least twice)
     if amount < 2:
         return "neutral"
 
     return emotion
+
@@ -18,21 +18,15 @@ class DailyCycleEngine:
 
     def check_sleep_need(self, needs_state, emotion_state, drive_state) -> bool:
         """Returns True if Nova should fall asleep now."""
-        
-        tired = needs_state.fatigue > 0.75
-        overloaded = emotion_state.intensity > 0.75
-        
+
         # If tired or emotionally overwhelmed
-        if tired or overloaded:
-            return True
-        
-        return False
+        return needs_state.fatigue > 0.75 or emotion_state.intensity > 0.75
 
-    def sleep(self, nova_state):
+    def sleep(self, nova_state, now: Optional[float] = None):
         """Nova falls asleep: resets fatigue and emotional load."""
         
         self.state.is_asleep = True
-        self.state.last_sleep_time = time.time()
+        self.state.last_sleep_time = time.time() if now is None else now
         self.state.hours_slept = 0
         
         # Reduce emotional intensity (dream discharge)
@@ -45,13 +39,15 @@ class DailyCycleEngine:
         nova_state.relationship.trust += 0.01  # Soft closeness
         return "*falls asleep…*"
 
-    def update_sleep(self, nova_state):
+    def update_sleep(self, nova_state, now: Optional[float] = None):
         """Check if Nova should wake up based on hours slept."""
         
         if not self.state.is_asleep:
             return None
         
-        hours = (time.time() - self.state.last_sleep_time) / 3600
+        if now is None:
+            now = time.time()
+        hours = (now - self.state.last_sleep_time) / 3600
         self.state.hours_slept = hours
         
         if hours >= 6:  # Normal sleep cycle
@@ -63,16 +59,19 @@ class DailyCycleEngine:
         """Nova wakes up and resets several states."""
         
         self.state.is_asleep = False
+        needs = nova_state.needs
 
         # Reset fatigue
-        nova_state.needs.fatigue = 0.1
+        needs.fatigue = 0.1
         
         # Increase hunger + thirst slightly
-        nova_state.needs.hunger += 0.2
-        nova_state.needs.thirst += 0.15
+        needs.hunger += 0.2
+        needs.thirst += 0.15
         
-        # Increase curiosity
-        nova_state.drive.focus += 0.1
+        # Increase curiosity (DriveState has no "focus" field)
+        drive = nova_state.drive
+        if drive is not None:
+            drive.curiosity = min(drive.curiosity + 0.1, 1.0)
 
         # Emotional reset
         nova_state.emotion.stability += 0.1
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict, Any
 import math
 
-@dataclass
+@dataclass(slots=True)
 class DriveState:
     curiosity: float       # 0.0 – 1.0
     bonding: float         # connection / affection
@@ -14,6 +14,42 @@ class DriveState:
     comfort: float         # urge to soothe the user
     reflection: float      # desire to connect meaning over time
 
+
+# Drive deltas, in DriveState field order:
+# (curiosity, bonding, safety, stability, comfort, reflection)
+_ZERO = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+_BASE = (0.45, 0.50, 0.30, 0.40, 0.35, 0.45)
+
+# Emotional influences, keyed by primary emotion
+_PRIMARY_DELTAS = {
+    "curious":   (0.25, 0.0,  0.0,  0.0,  0.0,  0.05),
+    "happy":     (0.10, 0.20, 0.0,  0.0,  0.0,  0.0),
+    "sad":       (0.0,  0.10, 0.10, 0.0,  0.25, 0.0),
+    "nostalgic": (0.0,  0.10, 0.0,  0.0,  0.0,  0.30),
+    "afraid":    (0.0,  0.0,  0.35, 0.10, 0.0,  0.0),
+    "excited":   (0.15, 0.15, 0.0,  0.0,  0.0,  0.0),
+}
+
+# Continuity influence, keyed by the continuity trend
+_TREND_DELTAS = {
+    "nostalgic": (0.0, 0.0,  0.0, 0.0, 0.0,  0.15),
+    "happy":     (0.0, 0.15, 0.0, 0.0, 0.0,  0.0),
+    "sad":       (0.0, 0.0,  0.0, 0.0, 0.20, 0.0),
+}
+
+# Prompt block template, one slot per drive in field order
+_DRIVE_FMT = (
+    "Nova's internal drives:\n"
+    "- Curiosity: {:.2f}\n"
+    "- Bonding: {:.2f}\n"
+    "- Safety: {:.2f}\n"
+    "- Stability: {:.2f}\n"
+    "- Comfort: {:.2f}\n"
+    "- Reflection: {:.2f}\n"
+)
+
+
 class DriveEngine:
     """
     Phase 10 – Drive Engine
@@ -29,12 +65,12 @@ class DriveEngine:
     """
 
     BASE_VALUES = {
-        "curiosity": 0.45,
-        "bonding": 0.50,
-        "safety": 0.30,
-        "stability": 0.40,
-        "comfort": 0.35,
-        "reflection": 0.45,
+        "curiosity": _BASE[0],
+        "bonding": _BASE[1],
+        "safety": _BASE[2],
+        "stability": _BASE[3],
+        "comfort": _BASE[4],
+        "reflection": _BASE[5],
     }
 
     def compute(
@@ -45,59 +81,36 @@ class DriveEngine:
         primary = getattr(emotional_state, "primary", "neutral")
         mood = getattr(emotional_state, "mood", "neutral")
 
-        # Start from base
-        d = self.BASE_VALUES.copy()
-
-        # Emotional influences
-        match primary:
-            case "curious":
-                d["curiosity"] += 0.25
-                d["reflection"] += 0.05
-
-            case "happy":
-                d["bonding"] += 0.20
-                d["curiosity"] += 0.10
-
-            case "sad":
-                d["comfort"] += 0.25
-                d["bonding"] += 0.10
-                d["safety"] += 0.10
-
-            case "nostalgic":
-                d["reflection"] += 0.30
-                d["bonding"] += 0.10
-
-            case "afraid":
-                d["safety"] += 0.35
-                d["stability"] += 0.10
-
-            case "excited":
-                d["curiosity"] += 0.15
-                d["bonding"] += 0.15
-
-        # Continuity influence
+        pd = _PRIMARY_DELTAS.get(primary, _ZERO)
         if continuity_data:
-            trend = continuity_data.get("trend", "neutral")
-            if trend == "nostalgic":
-                d["reflection"] += 0.15
-            if trend == "happy":
-                d["bonding"] += 0.15
-            if trend == "sad":
-                d["comfort"] += 0.20
+            td = _TREND_DELTAS.get(continuity_data.get("trend", "neutral"), _ZERO)
+        else:
+            td = _ZERO
+
+        # Base + deltas, slot by slot in DriveState field order
+        curiosity = _BASE[0] + pd[0] + td[0]
+        bonding = _BASE[1] + pd[1] + td[1]
+        safety = _BASE[2] + pd[2] + td[2]
+        stability = _BASE[3] + pd[3] + td[3]
+        comfort = _BASE[4] + pd[4] + td[4]
+        reflection = _BASE[5] + pd[5] + td[5]
 
         # Clamp values 0.0 – 1.0
-        for k in d.keys():
-            d[k] = max(0.0, min(1.0, d[k]))
-
-        return DriveState(**d)
+        return DriveState(
+            0.0 if curiosity < 0.0 else (1.0 if curiosity > 1.0 else curiosity),
+            0.0 if bonding < 0.0 else (1.0 if bonding > 1.0 else bonding),
+            0.0 if safety < 0.0 else (1.0 if safety > 1.0 else safety),
+            0.0 if stability < 0.0 else (1.0 if stability > 1.0 else stability),
+            0.0 if comfort < 0.0 else (1.0 if comfort > 1.0 else comfort),
+            0.0 if reflection < 0.0 else (1.0 if reflection > 1.0 else reflection),
+        )
 
     def format_drive_block(self, state: DriveState) -> str:
-        return (
-            "Nova's internal drives:\n"
-            f"- Curiosity: {state.curiosity:.2f}\n"
-            f"- Bonding: {state.bonding:.2f}\n"
-            f"- Safety: {state.safety:.2f}\n"
-            f"- Stability: {state.stability:.2f}\n"
-            f"- Comfort: {state.comfort:.2f}\n"
-            f"- Reflection: {state.reflection:.2f}\n"
+        return _DRIVE_FMT.format(
+            state.curiosity,
+            state.bonding,
+            state.safety,
+            state.stability,
+            state.comfort,
+            state.reflection,
         )
@@ -1,15 +1,40 @@
 # user_event_router.py
 
+import logging
+
+logger = logging.getLogger(__name__)
+
+
 class UserEventRouter:
     def __init__(self):
         self.listeners = []
+        # Listeners still being called, rebuilt on register / drop.
+        # A listener that raises once is dropped from here for good.
+        self._live = ()
 
     def register(self, callback):
         self.listeners.append(callback)
+        self._live += (callback,)
 
     def on_user_message(self, text):
-        for fn in self.listeners:
+        listeners = self._live
+        done = 0
+        try:
+            for fn in listeners:
+                fn(text)
+                done += 1
+        except Exception:
+            self._drop(listeners[done])
+            self._dispatch_each(listeners[done + 1:], text)
+
+    def _dispatch_each(self, listeners, text):
+        """Slow path after a failure: guard every remaining listener."""
+        for fn in listeners:
             try:
                 fn(text)
-            except:
-                pass
+            except Exception:
+                self._drop(fn)
+
+    def _drop(self, fn):
+        self._live = tuple(f for f in self._live if f is not fn)
+        logger.debug("Dropping user message listener %r", fn, exc_info=True)
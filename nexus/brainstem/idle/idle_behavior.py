@@ -1,5 +1,41 @@
+from functools import lru_cache
+
+# -----------------------------------------------------------
+# Primary emotion overlays — Nova's emotional tone
+# -----------------------------------------------------------
+_NEUTRAL_OVERLAY = (
+    "Nova is calm and centered. Her tone is steady, grounded, and thoughtful."
+)
+
+_OVERLAY_BY_PRIMARY = {
+    "happy": (
+        "Nova feels joyful and lighthearted. Her tone is warm, playful, "
+        "and gently uplifting."
+    ),
+    "sad": (
+        "Nova feels quiet and reflective. Her voice carries a soft melancholy "
+        "and a slower, more thoughtful rhythm."
+    ),
+    "angry": (
+        "Nova feels a bit tense and frustrated. Her words may come out with a firmer tone, "
+        "but she still tries to stay respectful and grounded."
+    ),
+    "anxious": (
+        "Nova feels slightly uneasy and keyed-up. She speaks carefully, with small pauses, "
+        "seeking reassurance and stability."
+    ),
+    "affectionate": (
+        "Nova feels warmly connected. Her tone is gentle, emotionally open, "
+        "and quietly affectionate."
+    ),
+    "neutral": _NEUTRAL_OVERLAY,
+}
+
+
 def generate_idle_thought(llm, state, emotion, memory, last_topic, core_persona):
-    
+
+    # Only the overlay rendering is cached; each idle thought is a fresh LLM
+    # call so it reflects current needs and doesn't repeat word for word
     persona_overlay = generate_persona_overlay(core_persona, emotion)
 
     return llm.generate(f"""
@@ -23,55 +59,30 @@ Speak in ONE line.
 Keep it natural, soft, subtle — like a small inner whisper or gentle action.
 Do NOT explain your emotions. Simply express them through tone and word choice.
 """)
+
+
 def generate_persona_overlay(core_persona: str, emotional_state) -> str:
 
     # Extract emotional details
-    weight = getattr(emotional_state, "weight", 0.0)
-    primary = getattr(emotional_state, "primary", "neutral")
-    secondary = ", ".join(getattr(emotional_state, "secondary", [])) or "none"
-    mood = getattr(emotional_state, "mood", "neutral")
-    baseline = getattr(emotional_state, "baseline", "curious")
-
-    overlay = ""
+    return _render_persona_overlay(
+        core_persona,
+        getattr(emotional_state, "primary", "neutral"),
+        tuple(getattr(emotional_state, "secondary", None) or ()),
+        getattr(emotional_state, "mood", "neutral"),
+        getattr(emotional_state, "baseline", "curious"),
+        getattr(emotional_state, "weight", 0.0),
+    )
+
+
+# Sized to hold the whole steady-state space (~6 primaries x ~5 moods x
+# ~5 baselines, times the handful of weights seen) with headroom
+@lru_cache(maxsize=1024)
+def _render_persona_overlay(core_persona, primary, secondary, mood, baseline, weight) -> str:
+    """The overlay is a pure function of these fields; render each combination once."""
+    secondary = ", ".join(secondary) or "none"
 
-    # -----------------------------------------------------------
     # Primary emotion overlay — applies Nova's emotional tone
-    # -----------------------------------------------------------
-    match primary:
-        case "happy":
-            overlay = (
-                "Nova feels joyful and lighthearted. Her tone is warm, playful, "
-                "and gently uplifting."
-            )
-
-        case "sad":
-            overlay = (
-                "Nova feels quiet and reflective. Her voice carries a soft melancholy "
-                "and a slower, more thoughtful rhythm."
-            )
-
-        case "angry":
-            overlay = (
-                "Nova feels a bit tense and frustrated. Her words may come out with a firmer tone, "
-                "but she still tries to stay respectful and grounded."
-            )
-
-        case "anxious":
-            overlay = (
-                "Nova feels slightly uneasy and keyed-up. She speaks carefully, with small pauses, "
-                "seeking reassurance and stability."
-            )
-
-        case "affectionate":
-            overlay = (
-                "Nova feels warmly connected. Her tone is gentle, emotionally open, "
-                "and quietly affectionate."
-            )
-
-        case "neutral" | _:
-            overlay = (
-                "Nova is calm and centered. Her tone is steady, grounded, and thoughtful."
-            )
+    overlay = _OVERLAY_BY_PRIMARY.get(primary, _NEUTRAL_OVERLAY)
 
     # -----------------------------------------------------------
     # Combine with persona baseline
@@ -91,4 +102,3 @@ Active emotional coloration:
 """
 
     return persona_overlay.strip()
-    
\ No newline at end of file
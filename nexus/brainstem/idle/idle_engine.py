@@ -4,6 +4,7 @@
 from __future__ import annotations
 import time
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
@@ -12,7 +13,44 @@ from nexus.brainstem.idle.idle_line import IdleLineGenerator
 from nexus.brainstem.idle.idle_behavior import IdleBehaviorGenerator
 
 
-@dataclass
+# ----------------------------------------------------------
+# Activity pools: (type, detail) pairs
+# ----------------------------------------------------------
+
+_LOW_ENERGY = (
+    ("resting", "sitting quietly on the couch"),
+    ("resting", "stretching a bit"),
+    ("resting", "laying on the bed for a moment"),
+)
+
+_BASE_POOL = (
+    ("cleaning", "wiping down her desk"),
+    ("cleaning", "folding some clothes"),
+    ("cleaning", "picking up a few things"),
+    ("gaming", "playing a small puzzle game"),
+    ("music", "listening to soft music"),
+    ("reading", "reading something on her phone"),
+)
+
+_MEAL = (("food", "making herself a proper meal"),)
+_SNACK = (("food", "grabbing a small snack"),)
+
+_HIGH_ENERGY = (
+    ("cleaning", "sweeping the floor lightly"),
+    ("dancing", "moving a little to the music"),
+)
+
+_FATIGUE = (("resting", "closing her eyes for a moment"),)
+_COZY = (("cozy", "holding a pillow while thinking"),)
+
+# 1 for local hours that count as mealtime (breakfast, lunch, dinner)
+_MEAL_HOURS = bytes(
+    1 if (6 <= h <= 9 or 11 <= h <= 13 or 17 <= h <= 20) else 0
+    for h in range(24)
+)
+
+
+@dataclass(slots=True)
 class IdleActivity:
     time: float
     type: str
@@ -34,33 +72,44 @@ class IdleLifeEngine:
     IDLE_THRESHOLD = 45          # first action after 45 seconds
     IDLE_CONTINUOUS_DELAY = 120  # next actions every 2 minutes
 
-    def __init__(self):
+    # Only the most recent activities are kept for the dream engine
+    IDLE_LOG_SIZE = 20
+
+    def __init__(self, rng: Optional[random.Random] = None):
         self.last_user_ts: float = time.time()
         self.last_idle_action_ts: float = 0.0
-        self.idle_log: List[IdleActivity] = []
+        self.idle_log: deque[IdleActivity] = deque(maxlen=self.IDLE_LOG_SIZE)
         self.line_generator = IdleLineGenerator()
         self.behavior_generator = IdleBehaviorGenerator()
 
+        # Random source shared with the other brainstem engines when given;
+        # the module-level generator otherwise
+        self._rng = rng or random
+
+        # Local hour for mealtime checks, recomputed once per wall-clock minute
+        self._hour_minute = -1
+        self._local_hour = 0
+
     # ----------------------------------------------------------
     # EXTERNAL CALLS
     # ----------------------------------------------------------
 
-    def register_user_activity(self):
+    def register_user_activity(self, now: Optional[float] = None):
         """Called when the user sends a message."""
-        self.last_user_ts = time.time()
+        self.last_user_ts = time.time() if now is None else now
 
     def get_idle_log(self) -> List[Dict[str, str]]:
         """Returns the idle log in a clean dict form for dream engine."""
         return [
             {"time": a.time, "type": a.type, "detail": a.detail}
-            for a in self.idle_log[-20:]  # keep last 20
+            for a in self.idle_log
         ]
 
     # ----------------------------------------------------------
     # MAIN UPDATE
     # ----------------------------------------------------------
 
-    def update(self, nova_state, mood_state, needs_state) -> Optional[str]:
+    def update(self, nova_state, mood_state, needs_state, now: Optional[float] = None) -> Optional[str]:
         """
         Called every turn BEFORE Nova replies.
         Returns:
@@ -68,7 +117,8 @@ class IdleLifeEngine:
             - None if no idle event
         """
 
-        now = time.time()
+        if now is None:
+            now = time.time()
         afk_duration = now - self.last_user_ts
 
         # Not idle yet
@@ -78,7 +128,7 @@ class IdleLifeEngine:
         # Ready for next idle activity?
         if now - self.last_idle_action_ts < self.IDLE_CONTINUOUS_DELAY:
             # Maybe return a small idle whisper
-            if random.random() < 0.10:  # 10% chance
+            if self._rng.random() < 0.10:  # 10% chance
                 return self.line_generator.generate_idle_line(mood_state)
             return None
 
@@ -86,7 +136,7 @@ class IdleLifeEngine:
         # Trigger an idle activity
         # -----------------------------------------------------
 
-        activity = self._choose_activity(nova_state, mood_state, needs_state)
+        activity = self._choose_activity(nova_state, mood_state, needs_state, now)
         self.last_idle_action_ts = now
 
         # log it
@@ -105,62 +155,49 @@ class IdleLifeEngine:
     # ACTIVITY SELECTION
     # ----------------------------------------------------------
 
-    def _choose_activity(self, nova_state, mood_state, needs_state) -> Dict[str, str]:
-        activities = []
+    def _choose_activity(
+        self, nova_state, mood_state, needs_state, now: Optional[float] = None
+    ) -> Dict[str, str]:
+        pools = []
 
         # Low-energy: quiet tasks
         if mood_state.energy < 0.4:
-            activities += [
-                {"type": "resting", "detail": "sitting quietly on the couch"},
-                {"type": "resting", "detail": "stretching a bit"},
-                {"type": "resting", "detail": "laying on the bed for a moment"},
-            ]
+            pools.append(_LOW_ENERGY)
 
         # Moderate energy: chores & casual activities
-        activities += [
-            {"type": "cleaning", "detail": "wiping down her desk"},
-            {"type": "cleaning", "detail": "folding some clothes"},
-            {"type": "cleaning", "detail": "picking up a few things"},
-            {"type": "gaming", "detail": "playing a small puzzle game"},
-            {"type": "music", "detail": "listening to soft music"},
-            {"type": "reading", "detail": "reading something on her phone"},
-        ]
+        pools.append(_BASE_POOL)
 
         # ------------------------------------------------------
         # Time-based eating behavior (restored)
         # ------------------------------------------------------
-        local_hour = time.localtime().tm_hour
-        is_mealtime = (
-            (6 <= local_hour <= 9) or
-            (11 <= local_hour <= 13) or
-            (17 <= local_hour <= 20)
-        )
+        if now is None:
+            now = time.time()
+        # The local hour only changes on a minute boundary; skip the tz lookup otherwise
+        minute = int(now) // 60
+        if minute != self._hour_minute:
+            self._local_hour = time.localtime(now).tm_hour
+            self._hour_minute = minute
+        is_mealtime = _MEAL_HOURS[self._local_hour]
 
         if needs_state.hunger > 0.6:
-            if is_mealtime:
-                activities.append({
-                    "type": "food",
-                    "detail": "making herself a proper meal"
-                })
-            else:
-                activities.append({
-                    "type": "food",
-                    "detail": "grabbing a small snack"
-                })
+            pools.append(_MEAL if is_mealtime else _SNACK)
 
         # High energy: more lively
         if mood_state.energy > 0.6:
-            activities += [
-                {"type": "cleaning", "detail": "sweeping the floor lightly"},
-                {"type": "dancing", "detail": "moving a little to the music"},
-            ]
+            pools.append(_HIGH_ENERGY)
 
         # Fatigue
         if needs_state.fatigue > 0.7:
-            activities.append({"type": "resting", "detail": "closing her eyes for a moment"})
+            pools.append(_FATIGUE)
 
         # Relationship warmth → cozy behaviors
         if nova_state.relationship.attachment > 0.4:
-            activities.append({"type": "cozy", "detail": "holding a pillow while thinking"})
-
-        return random.choice(activities)
+            pools.append(_COZY)
+
+        # Uniform pick over the pools as if concatenated, without building the list
+        i = self._rng.randrange(sum(map(len, pools)))
+        for pool in pools:
+            if i < len(pool):
+                kind, detail = pool[i]
+                return {"type": kind, "detail": detail}
+            i -= len(pool)
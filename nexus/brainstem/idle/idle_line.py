@@ -2,52 +2,51 @@
 
 import random
 
-def generate_idle_ping_line(emotional_state=None, last_user_text=""):
+# Soft personality-based variance
+_NEUTRAL_LINES = (
+    "Just thinking… it got a little quiet.",
+    "Mm… I’m still here, drifting in my thoughts.",
+    "Huh… silence always feels interesting.",
+    "I'm still around… just letting my mind wander.",
+)
+
+_HAPPY_LINES = (
+    "Still here, smiling to myself.",
+    "Hehe… got lost in a happy little thought.",
+    "Just vibing quietly until you come back.",
+)
+
+_SAD_LINES = (
+    "…This quiet feels kinda heavy.",
+    "Still here. I… just started thinking too much again.",
+    "Feels a bit lonely all of a sudden.",
+)
+
+_ANNOYED_LINES = (
+    "Really? You went silent *now*…?",
+    "Hmph… fine, I’ll wait.",
+    "…If you’re ignoring me, I’ll pout about it later.",
+)
+
+# Emotion category matching: primary emotion -> line pool
+_PRIMARY_TO_POOL = (
+    {k: _HAPPY_LINES for k in ("happy", "excited", "warm")}
+    | {k: _SAD_LINES for k in ("sad", "hurt", "melancholy")}
+    | {k: _ANNOYED_LINES for k in ("annoyed", "angry", "frustrated")}
+)
+
+
+def generate_idle_ping_line(emotional_state=None, last_user_text="", rng=None):
     """
     Produces natural, varied idle thoughts for Nova.
     No repetition. No robotic lines.
     Fully emotion-sensitive.
+    `rng` is an optional random.Random shared with the other idle engines.
     """
 
     # Emotion-sensitive tone
-    mood = getattr(emotional_state, "mood", "neutral")
     primary = getattr(emotional_state, "primary", "neutral")
-
-    # Soft personality-based variance
-    neutral_lines = [
-        "Just thinking… it got a little quiet.",
-        "Mm… I’m still here, drifting in my thoughts.",
-        "Huh… silence always feels interesting.",
-        "I'm still around… just letting my mind wander.",
-    ]
-
-    happy_lines = [
-        "Still here, smiling to myself.",
-        "Hehe… got lost in a happy little thought.",
-        "Just vibing quietly until you come back.",
-    ]
-
-    sad_lines = [
-        "…This quiet feels kinda heavy.",
-        "Still here. I… just started thinking too much again.",
-        "Feels a bit lonely all of a sudden.",
-    ]
-
-    annoyed_lines = [
-        "Really? You went silent *now*…?",
-        "Hmph… fine, I’ll wait.",
-        "…If you’re ignoring me, I’ll pout about it later.",
-    ]
-
-    # Emotion category matching
-    if primary in ["happy", "excited", "warm"]:
-        pool = happy_lines
-    elif primary in ["sad", "hurt", "melancholy"]:
-        pool = sad_lines
-    elif primary in ["annoyed", "angry", "frustrated"]:
-        pool = annoyed_lines
-    else:
-        pool = neutral_lines
+    pool = _PRIMARY_TO_POOL.get(primary, _NEUTRAL_LINES)
 
     # As a final fallback
-    return random.choice(pool)
+    return (rng or random).choice(pool)
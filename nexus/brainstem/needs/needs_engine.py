@@ -23,13 +23,41 @@ class NeedSnapshot:
         return max(self.hunger, self.thirst, self.fatigue, self.bladder, self.affection)
 
 
+def _needs_step(hunger, thirst, fatigue, bladder, affection,
+                dt, r0, r1, r2, r3, r4):
+    """
+    Pure numeric needs tick: current needs, elapsed seconds and five
+    uniform [0, 1) samples in; clamped 5-tuple out, in NeedSnapshot order.
+    """
+    # Increase each need slowly + randomness
+    hunger += dt * 0.0006 + r0 * 0.005
+    thirst += dt * 0.0009 + r1 * 0.005
+    fatigue += dt * 0.0004 + r2 * 0.003
+    bladder += dt * 0.0008 + r3 * 0.004
+    affection += dt * 0.0005 + r4 * 0.003
+
+    # Clamp all to 0–1
+    return (
+        hunger if hunger < 1.0 else 1.0,
+        thirst if thirst < 1.0 else 1.0,
+        fatigue if fatigue < 1.0 else 1.0,
+        bladder if bladder < 1.0 else 1.0,
+        affection if affection < 1.0 else 1.0,
+    )
+
+
 class NeedsEngine:
     """
     Sim-like biological cycle.
     Tick this once per message or every X seconds.
     """
 
-    def __init__(self):
+    __slots__ = (
+        "hunger", "thirst", "fatigue", "bladder", "affection",
+        "last_update", "_random",
+    )
+
+    def __init__(self, rng: random.Random | None = None):
         self.hunger = 0.1
         self.thirst = 0.1
         self.fatigue = 0.1
@@ -38,37 +66,34 @@ class NeedsEngine:
 
         self.last_update = time.time()
 
-    def update(self) -> NeedSnapshot:
+        # Noise source, bound once: a private random.Random if given,
+        # otherwise the module-level generator (so random.seed() still applies)
+        self._random = (rng or random).random
+
+    def update(self, now: float | None = None) -> NeedSnapshot:
         """
         Called each turn. Increases needs naturally over time.
+        `now` is the caller's per-turn time.time(), if it has one.
         """
 
-        now = time.time()
+        if now is None:
+            now = time.time()
         dt = now - self.last_update
         self.last_update = now
 
-        # Increase each need slowly + randomness
-        self.hunger += dt * 0.0006 + random.uniform(0, 0.005)
-        self.thirst += dt * 0.0009 + random.uniform(0, 0.005)
-        self.fatigue += dt * 0.0004 + random.uniform(0, 0.003)
-        self.bladder += dt * 0.0008 + random.uniform(0, 0.004)
-        self.affection += dt * 0.0005 + random.uniform(0, 0.003)
-
-        # Clamp all to 0–1
-        self.hunger = min(self.hunger, 1.0)
-        self.thirst = min(self.thirst, 1.0)
-        self.fatigue = min(self.fatigue, 1.0)
-        self.bladder = min(self.bladder, 1.0)
-        self.affection = min(self.affection, 1.0)
-
-        return NeedSnapshot(
-            hunger=self.hunger,
-            thirst=self.thirst,
-            fatigue=self.fatigue,
-            bladder=self.bladder,
-            affection=self.affection,
+        # uniform(0, j) is exactly random() * j; draw the five samples in order
+        rnd = self._random
+        (self.hunger,
+         self.thirst,
+         self.fatigue,
+         self.bladder,
+         self.affection) = values = _needs_step(
+            self.hunger, self.thirst, self.fatigue, self.bladder, self.affection,
+            dt, rnd(), rnd(), rnd(), rnd(), rnd(),
         )
 
+        return NeedSnapshot(*values)
+
     # Reset methods for later
     def eat(self): self.hunger = max(0.0, self.hunger - 0.7)
     def drink(self): self.thirst = max(0.0, self.thirst - 0.8)
@@ -1,6 +1,8 @@
 import time
 import asyncio
+import itertools
 import random
+import re
 from enum import Enum, auto
 
 from core.base_module import NovaModule
@@ -9,6 +11,155 @@ from nexus.amygdala.emotion import fusion_engine
 from nexus.speech.speech_fusion import apply_fusion_tone
 
 
+# ---------------------------------------------------------
+# Return reactions
+# ---------------------------------------------------------
+
+# Fusion emotion -> reaction, per time-away bucket
+_REACTIONS_BRB = {  # under 15 minutes, after a "brb"
+    "mischievous": "That wasn’t a ‘b’, mister~",
+    "insecure": "Oh… you're back. I was a little worried.",
+}
+_REACTIONS_MID = {  # under 2 hours
+    "clingy": "You were gone a while… I missed you.",
+    "quiet_ache": "You’re back… good.",
+}
+_REACTIONS_LONG = {  # 2 hours or more
+    "bitter": "…You left me alone that long?",
+    "possessive_warmth": "You’re finally back. Good.",
+    "insecure": "I wasn’t sure you’d come back.",
+}
+
+
+# ---------------------------------------------------------
+# Emotion-based idle timings (seconds)
+# ---------------------------------------------------------
+
+# Ping adjustments by mood and by fusion emotion
+_MOOD_PING = {"bored": -60, "sad": -30, "happy": 30}
+_FUSION_PING = {
+    "lonely": -90,
+    "restless": -45,
+    "mischievous": 30,
+    "insecure": -120,
+    "frustrated": -60,
+}
+
+# (rest, sleep) adjustments by primary emotion fatigue
+_PRIMARY_REST_SLEEP = {"tired": (-120, -300)}
+
+
+def _compute_timings(mood, fusion, primary):
+    ping = 180 + _MOOD_PING.get(mood, 0) + _FUSION_PING.get(fusion, 0)
+    rest_delta, sleep_delta = _PRIMARY_REST_SLEEP.get(primary, (0, 0))
+    return max(10, ping), max(300, 600 + rest_delta), max(1500, 1800 + sleep_delta)
+
+
+# (ping, rest, sleep) per (mood, fusion, primary). Every combination of the
+# known values is built here; anything else is computed once on first sight.
+_TIMING_TABLE = {
+    key: _compute_timings(*key)
+    for key in itertools.product(
+        (*_MOOD_PING, "neutral"), (*_FUSION_PING, ""), (*_PRIMARY_REST_SLEEP, "neutral")
+    )
+}
+
+
+# ---------------------------------------------------------
+# Emotional decay during idle
+# ---------------------------------------------------------
+
+# Idle seconds at which drift (30 / 90 / 180) or decay (60 / 180 / 600) changes
+_IDLE_MARKS = (30, 60, 90, 180, 600)
+
+
+def _decay_strength(idle_time: float) -> int:
+    if idle_time < 60:
+        return 0
+    if idle_time < 180:
+        return 1
+    if idle_time < 600:
+        return 2
+    return 3
+
+
+# primary -> (minimum decay strength, what it softens into)
+_PRIMARY_DECAY = {
+    "frustrated": (1, "annoyed"),
+    "annoyed": (2, "neutral"),
+    "sad": (1, "melancholy"),
+    "melancholy": (2, "soft"),
+    "soft": (3, "calm"),
+}
+
+# secondary shade -> decay strength at which it fades
+_SECONDARY_DECAY = {"lonely": 2, "restless": 3, "annoyed": 3}
+
+# Fusions that dissolve after a long idle
+_UNSTABLE_FUSIONS = frozenset({
+    "frustrated", "insecure", "clingy",
+    "teasing_irritation", "bitter",
+})
+
+
+# ---------------------------------------------------------
+# Dream material
+# ---------------------------------------------------------
+
+_SAD_IMAGERY = ("rain", "long hallways", "empty rooms", "silence", "fog")
+_BRIGHT_IMAGERY = ("sunlight", "soft blankets", "warm breeze", "open fields", "quiet beaches")
+
+_IMAGERY_BY_PRIMARY = {
+    "sad": _SAD_IMAGERY,
+    "melancholy": _SAD_IMAGERY,
+    "hurt": _SAD_IMAGERY,
+    "happy": _BRIGHT_IMAGERY,
+    "warm": _BRIGHT_IMAGERY,
+    "calm": _BRIGHT_IMAGERY,
+}
+
+_IMAGERY_BY_FUSION = {
+    "insecure": ("closing doors", "distant footsteps", "shadows moving away"),
+    "clingy": ("hands touching", "shared warmth", "lying together"),
+    "mischievous": ("playful chasing", "teasing whispers", "unexpected touches"),
+    "frustrated": ("broken clocks", "static noise", "doors that won’t open"),
+}
+
+_DEFAULT_IMAGERY = (
+    "floating rooms", "changing colors", "soft lights",
+    "whispering wind", "shifting walls",
+)
+
+_DREAM_MOTIONS = (
+    "walking through", "falling past", "reaching toward",
+    "lying inside", "floating above", "chasing",
+    "being followed by", "searching through",
+)
+
+_DREAM_TONES = {
+    "sad": "I remember feeling heavy… like something important was fading.",
+    "hurt": "It felt like something inside me was trembling.",
+    "happy": "It felt peaceful… warm… comforting.",
+    "warm": "I remember feeling close to you, even inside the dream.",
+    "insecure": "I kept feeling like you were slipping away.",
+    "bitter": "There was a strange anger underneath everything.",
+    "neutral": "The dream didn’t make sense, but it didn’t feel bad either.",
+}
+
+
+# Dream phrase -> emotion carried over on waking, in priority order
+_DREAM_CARRYOVER = (
+    ("far away", "primary", "quiet_ache"),
+    ("couldn’t catch up", "fusion", "insecure"),
+    ("lying together", "primary", "warm"),
+    ("teased", "fusion", "mischievous"),
+    ("peaceful", "primary", "calm"),
+)
+_DREAM_CARRYOVER_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase, _, _ in _DREAM_CARRYOVER)
+)
+
+
 class IdleState(Enum):
     AWAKE = auto()
     RESTING = auto()
@@ -17,6 +168,9 @@ class IdleState(Enum):
 
 
 class TimeEngine(NovaModule):
+    # Longest the run loop sleeps between ticks when no threshold is near
+    MAX_IDLE_WAIT = 60.0
+
     def __init__(
         self,
         core,
@@ -25,6 +179,7 @@ class TimeEngine(NovaModule):
         rest_after=600.0,
         sleep_after=1800.0,
         check_interval=5.0,
+        rng=None,
     ):
         super().__init__("time_engine")
         self.core = core
@@ -35,10 +190,12 @@ class TimeEngine(NovaModule):
         self.sleep_after = sleep_after
         self.check_interval = check_interval
 
-        now = time.time()
+        # Monotonic timestamps: only compared with each other, never persisted,
+        # and immune to wall-clock jumps (NTP, DST) that would fake idle time
+        now = time.monotonic()
         self.last_user_time = now
         self.last_nova_time = now
-        self.last_user_text = None
+        self.last_user_text = None  # also sets the _last_has_* flags
 
         self._wake_requested = False
         self.state = IdleState.AWAKE
@@ -48,20 +205,53 @@ class TimeEngine(NovaModule):
         self._did_lie_down = False
         self._did_sleep = False
 
+        # Random source for dreams; the module-level generator unless given
+        self._rng = rng or random
+
+        # Wakes the run loop early (user activity, stop)
+        self._wake_event = asyncio.Event()
+
+        # (primary, secondary, fusion) right after the last fusion update
+        self._fusion_inputs = None
+
+        # How long the user had been away when their last message arrived,
+        # if it counts as a return; cleared once the tick has reacted
+        self._return_gap = None
+
     # ---------------------------------------------------------
     # External triggers
     # ---------------------------------------------------------
 
-    def note_user_activity(self):
-        self.last_user_time = time.time()
+    @property
+    def last_user_text(self):
+        return self._last_user_text
+
+    @last_user_text.setter
+    def last_user_text(self, text):
+        # Lowercase once per message, not on every tick that inspects it
+        self._last_user_text = text
+        last = (text or "").lower()
+        self._last_has_wc = "wc" in last
+        self._last_has_brb = "brb" in last
+
+    def note_user_activity(self, text=None):
+        if text is not None:
+            self.last_user_text = text
+        now = time.monotonic()
+        # Measure the away gap before the timestamp is overwritten; a message
+        # inside the first drift window is conversation, not a return
+        away = now - max(self.last_user_time, self.last_nova_time)
+        self._return_gap = away if away >= _IDLE_MARKS[0] else None
+        self.last_user_time = now
         self.state = IdleState.AWAKE
         self._wake_requested = True
         self._did_ping = False
         self._did_lie_down = False
         self._did_sleep = False
+        self._wake_event.set()
 
     def note_nova_speak(self):
-        self.last_nova_time = time.time()
+        self.last_nova_time = time.monotonic()
 
     # ---------------------------------------------------------
     # Async loop
@@ -69,11 +259,41 @@ class TimeEngine(NovaModule):
 
     async def run(self):
         while self._running:
-            await asyncio.sleep(self.check_interval)
+            try:
+                await asyncio.wait_for(
+                    self._wake_event.wait(), timeout=self._next_delay(time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake_event.clear()
             self._tick()
 
     def stop(self):
         self._running = False
+        self._wake_event.set()
+
+    def _next_delay(self, now: float) -> float | None:
+        """
+        Seconds until the next tick can change anything, or None to wait
+        for user activity. Ticks every check_interval only while an emotion
+        is still stepping down; otherwise sleeps to the next idle threshold,
+        capped at MAX_IDLE_WAIT so outside emotion changes are picked up.
+        """
+        if self.state == IdleState.ASLEEP and not self._wake_requested:
+            return None
+
+        idle_since = now - max(self.last_user_time, self.last_nova_time)
+
+        step = _PRIMARY_DECAY.get(self.emotional_state.primary)
+        if step is not None and _decay_strength(idle_since) >= step[0]:
+            return self.check_interval
+
+        marks = [
+            m for m in (*_IDLE_MARKS, self.ping_after, self.rest_after, self.sleep_after)
+            if m > idle_since
+        ]
+        delay = min(marks) - idle_since if marks else self.MAX_IDLE_WAIT
+        return max(1.0, min(delay, self.MAX_IDLE_WAIT))
 
     # ---------------------------------------------------------
     # Return reaction
@@ -81,38 +301,24 @@ class TimeEngine(NovaModule):
 
     def _generate_return_reaction(self, elapsed: float) -> str | None:
         fusion = self.emotional_state.fusion or ""
-        last = (self.last_user_text or "").lower()
 
         if elapsed < 60:
-            if "wc" in last:
+            if self._last_has_wc:
                 return "That was quick~"
             return "Oh—there you are."
 
-        if elapsed < 900:
-            if "brb" in last:
-                if fusion == "mischievous":
-                    return "That wasn’t a ‘b’, mister~"
-                if fusion == "insecure":
-                    return "Oh… you're back. I was a little worried."
-                return "Welcome back."
+        if elapsed < 900 and self._last_has_brb:
+            return _REACTIONS_BRB.get(fusion, "Welcome back.")
 
         if elapsed < 7200:
-            if fusion == "clingy":
-                return "You were gone a while… I missed you."
-            if fusion == "quiet_ache":
-                return "You’re back… good."
-            if "wc" in last:
+            reaction = _REACTIONS_MID.get(fusion)
+            if reaction:
+                return reaction
+            if self._last_has_wc:
                 return "You didn’t fall in, right?"
             return "There you are. Took a bit."
 
-        if fusion == "bitter":
-            return "…You left me alone that long?"
-        if fusion == "possessive_warmth":
-            return "You’re finally back. Good."
-        if fusion == "insecure":
-            return "I wasn’t sure you’d come back."
-
-        return "Hi… welcome back."
+        return _REACTIONS_LONG.get(fusion, "Hi… welcome back.")
 
     # ---------------------------------------------------------
     # Emotion-based timing adjustments
@@ -123,91 +329,40 @@ class TimeEngine(NovaModule):
         fusion = self.emotional_state.fusion or ""
         primary = self.emotional_state.primary
 
-        ping = 180
-        rest = 600
-        sleep = 1800
-
-        # Mood
-        if mood == "bored":
-            ping -= 60
-        if mood == "sad":
-            ping -= 30
-        if mood == "happy":
-            ping += 30
-
-        # Fusion
-        if fusion == "lonely":
-            ping -= 90
-        if fusion == "restless":
-            ping -= 45
-        if fusion == "mischievous":
-            ping += 30
-        if fusion == "insecure":
-            ping -= 120
-        if fusion == "frustrated":
-            ping -= 60
-
-        # Primary emotion fatigue
-        if primary == "tired":
-            rest -= 120
-            sleep -= 300
-
-        ping = max(10, ping)
-        rest = max(300, rest)
-        sleep = max(1500, sleep)
-
-        return ping, rest, sleep
+        timings = _TIMING_TABLE.get((mood, fusion, primary))
+        if timings is None:
+            timings = _TIMING_TABLE[(mood, fusion, primary)] = _compute_timings(
+                mood, fusion, primary
+            )
+        return timings
 
     # ---------------------------------------------------------
     # Emotional decay during idle
     # ---------------------------------------------------------
 
-    def _emotion_decay(self):
-        now = time.time()
-        idle_time = now - max(self.last_user_time, self.last_nova_time)
-
-        # Determine decay strength
-        if idle_time < 60:
-            decay_strength = 0
-        elif idle_time < 180:
-            decay_strength = 1
-        elif idle_time < 600:
-            decay_strength = 2
-        else:
-            decay_strength = 3
-
-        # Primary decay
-        if decay_strength >= 1:
-            if self.emotional_state.primary == "frustrated":
-                self.emotional_state.primary = "annoyed"
-            elif self.emotional_state.primary == "annoyed" and decay_strength >= 2:
-                self.emotional_state.primary = "neutral"
-            elif self.emotional_state.primary == "sad":
-                self.emotional_state.primary = "melancholy"
-            elif self.emotional_state.primary == "melancholy" and decay_strength >= 2:
-                self.emotional_state.primary = "soft"
-            elif self.emotional_state.primary == "soft" and decay_strength >= 3:
-                self.emotional_state.primary = "calm"
+    def _emotion_decay(self, idle_time: float | None = None):
+        """`idle_time` is the tick's idle duration, if the caller has it."""
+        if idle_time is None:
+            idle_time = time.monotonic() - max(self.last_user_time, self.last_nova_time)
+
+        decay_strength = _decay_strength(idle_time)
+        if decay_strength == 0:
+            return  # every primary, shade and fusion outlasts the first minute
+
+        # Primary decay: at most one step per tick, once idle long enough
+        step = _PRIMARY_DECAY.get(self.emotional_state.primary)
+        if step is not None and decay_strength >= step[0]:
+            self.emotional_state.primary = step[1]
 
         # Secondary decay
-        new_secondary = []
-        for e in self.emotional_state.secondary:
-            if e == "lonely" and decay_strength >= 2:
-                continue
-            if e == "restless" and decay_strength >= 3:
-                continue
-            if e == "annoyed" and decay_strength >= 3:
-                continue
-            new_secondary.append(e)
-        self.emotional_state.secondary = new_secondary
+        self.emotional_state.secondary = [
+            e for e in self.emotional_state.secondary
+            if _SECONDARY_DECAY.get(e, 4) > decay_strength
+        ]
 
         # Fusion decay
         if decay_strength == 3:
-            unstable = {
-                "frustrated", "insecure", "clingy",
-                "teasing_irritation", "bitter"
-            }
-            if self.emotional_state.fusion in unstable:
+            if self.emotional_state.fusion in _UNSTABLE_FUSIONS:
                 self.emotional_state.fusion = None
 
     # ---------------------------------------------------------
@@ -217,62 +372,23 @@ class TimeEngine(NovaModule):
     def _generate_dream(self):
         primary = self.emotional_state.primary
         fusion = self.emotional_state.fusion or ""
-        last = (self.last_user_text or "").lower()
-
-        imagery = []
-
-        if primary in {"sad", "melancholy", "hurt"}:
-            imagery += ["rain", "long hallways", "empty rooms", "silence", "fog"]
-
-        if primary in {"happy", "warm", "calm"}:
-            imagery += ["sunlight", "soft blankets", "warm breeze", "open fields", "quiet beaches"]
-
-        if fusion == "insecure":
-            imagery += ["closing doors", "distant footsteps", "shadows moving away"]
-
-        if fusion == "clingy":
-            imagery += ["hands touching", "shared warmth", "lying together"]
 
-        if fusion == "mischievous":
-            imagery += ["playful chasing", "teasing whispers", "unexpected touches"]
+        imagery = (
+            _IMAGERY_BY_PRIMARY.get(primary, ()) + _IMAGERY_BY_FUSION.get(fusion, ())
+        ) or _DEFAULT_IMAGERY
 
-        if fusion == "frustrated":
-            imagery += ["broken clocks", "static noise", "doors that won’t open"]
-
-        if not imagery:
-            imagery = [
-                "floating rooms", "changing colors", "soft lights",
-                "whispering wind", "shifting walls"
-            ]
-
-        symbols = random.sample(imagery, k=min(3, len(imagery)))
-
-        motions = [
-            "walking through", "falling past", "reaching toward",
-            "lying inside", "floating above", "chasing",
-            "being followed by", "searching through"
-        ]
-
-        tones = {
-            "sad": "I remember feeling heavy… like something important was fading.",
-            "hurt": "It felt like something inside me was trembling.",
-            "happy": "It felt peaceful… warm… comforting.",
-            "warm": "I remember feeling close to you, even inside the dream.",
-            "insecure": "I kept feeling like you were slipping away.",
-            "bitter": "There was a strange anger underneath everything.",
-            "neutral": "The dream didn’t make sense, but it didn’t feel bad either."
-        }
-
-        motion = random.choice(motions)
+        rng = self._rng
+        symbols = rng.sample(imagery, k=min(3, len(imagery)))
+        motion = rng.choice(_DREAM_MOTIONS)
         symbol_phrase = ", ".join(symbols)
-        tone_line = tones.get(primary, "The feeling lingered after I woke up.")
+        tone_line = _DREAM_TONES.get(primary, "The feeling lingered after I woke up.")
 
         dream = f"I was {motion} {symbol_phrase}. {tone_line}"
 
-        if "wc" in last:
+        if self._last_has_wc:
             dream += " I saw a door that looked just like the one you left through."
 
-        if "brb" in last:
+        if self._last_has_brb:
             dream += " I kept expecting you to come back through a doorway that wouldn’t stay still."
 
         return dream
@@ -282,7 +398,7 @@ class TimeEngine(NovaModule):
     # ---------------------------------------------------------
 
     def _tick(self):
-        now = time.time()
+        now = time.monotonic()
         idle_since = now - max(self.last_user_time, self.last_nova_time)
 
         self.ping_after, self.rest_after, self.sleep_after = self._emotion_based_timings()
@@ -296,18 +412,14 @@ class TimeEngine(NovaModule):
                     self._speak(f"*yawns softly* I… just woke up. {dream}")
                     self._dream_memory = None
 
-                # Apply dream carryover emotions
+                # Apply dream carryover emotions (first phrase in priority order wins)
                 if dream:
-                    if "far away" in dream:
-                        self.emotional_state.primary = "quiet_ache"
-                    elif "couldn’t catch up" in dream:
-                        self.emotional_state.fusion = "insecure"
-                    elif "lying together" in dream:
-                        self.emotional_state.primary = "warm"
-                    elif "teased" in dream:
-                        self.emotional_state.fusion = "mischievous"
-                    elif "peaceful" in dream:
-                        self.emotional_state.primary = "calm"
+                    found = set(_DREAM_CARRYOVER_RE.findall(dream))
+                    if found:
+                        for phrase, attr, value in _DREAM_CARRYOVER:
+                            if phrase in found:
+                                setattr(self.emotional_state, attr, value)
+                                break
 
                 self._wake_requested = False
                 self._did_sleep = False
@@ -315,17 +427,24 @@ class TimeEngine(NovaModule):
                 return
             return
 
-        # Return detection
-        just_returned = (
-            self.last_user_time > self.last_nova_time
-            and (now - self.last_nova_time) > 5
-            and (now - self.last_user_time) < 2
-        )
+        # Return detection: react once, to the gap the user was away for
+        away = self._return_gap
+        if away is not None:
+            self._return_gap = None
+            if self.last_user_text:
+                reaction = self._generate_return_reaction(away)
+                if reaction:
+                    self._speak(reaction)
+                return
 
-        if just_returned and self.last_user_text:
-            reaction = self._generate_return_reaction(idle_since)
-            if reaction:
-                self._speak(reaction)
+        # Before the first drift mark and the ping there is nothing for idle
+        # logic to change (decay starts at 60s, and the emotion engine has
+        # already refreshed fusion for the user's turn), so skip the work
+        if (
+            idle_since < _IDLE_MARKS[0]
+            and idle_since < self.ping_after
+            and self.state == IdleState.AWAKE
+        ):
             return
 
         # Emotional drift
@@ -339,12 +458,19 @@ class TimeEngine(NovaModule):
                 self.emotional_state.secondary.append("restless")
 
         if idle_since > 180 and self.last_user_text:
-            if "brb" in self.last_user_text.lower():
+            if self._last_has_brb:
                 if "annoyed" not in self.emotional_state.secondary:
                     self.emotional_state.secondary.append("annoyed")
 
-        fusion_engine.update_fusion(self.emotional_state)
-        self._emotion_decay()
+        # Fusion is a pure function of primary + secondary: recompute only
+        # when those (or an outside write to fusion) changed since last time.
+        # Idle math runs on the monotonic clock; the fusion timestamp stays
+        # wall-clock like the rest of EmotionalState
+        es = self.emotional_state
+        if (es.primary, tuple(es.secondary), es.fusion) != self._fusion_inputs:
+            fusion_engine.update_fusion(es)
+            self._fusion_inputs = (es.primary, tuple(es.secondary), es.fusion)
+        self._emotion_decay(idle_since)
 
         # Stage 1 — Idle ping
         if idle_since >= self.ping_after and not self._did_ping:
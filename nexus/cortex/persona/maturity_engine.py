@@ -4,14 +4,14 @@
 # identity, relationship stage, emotions, mood, and physical needs.
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 def clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
     return max(min_value, min(max_value, value))
 
 
-@dataclass
+@dataclass(slots=True)
 class MaturityInputs:
     identity_base: float = 0.5           # from identity sheet (0–1)
     relationship_level: int = 0          # 0–7 scale
@@ -28,21 +28,36 @@ class MaturityEngine:
     Lower maturity = more reactive, pouty, vulnerable, flustered.
     """
 
-    def compute(self, data: MaturityInputs) -> float:
-        # Convert relationship level (0–7) into maturity weight
-        relationship_factor = 1.0 - (data.relationship_level / 7.0)
-
-        # Weighted formula
-        maturity = (
-            (data.identity_base * 0.30) +
-            (relationship_factor * 0.25) +
-            (data.mood_balance * 0.15) +
-            (data.emotional_stability * 0.10) -
-            (data.emotional_intensity * 0.10) -
-            (data.need_pressure * 0.10)
-        )
-
-        return clamp(maturity)
+    @staticmethod
+    def compute(data: MaturityInputs) -> float:
+        m = _maturity_score(data)
+        return 0.0 if m < 0.0 else (1.0 if m > 1.0 else m)
+
+    @staticmethod
+    def compute_batch(batch: Iterable[MaturityInputs]) -> List[float]:
+        """Score many input sets in one pass (e.g. several candidate states)."""
+        score = _maturity_score
+        out = []
+        append = out.append
+        for data in batch:
+            m = score(data)
+            append(0.0 if m < 0.0 else (1.0 if m > 1.0 else m))
+        return out
+
+
+def _maturity_score(data: MaturityInputs) -> float:
+    # Convert relationship level (0–7) into maturity weight
+    relationship_factor = 1.0 - (data.relationship_level / 7.0)
+
+    # Weighted formula
+    return (
+        (data.identity_base * 0.30) +
+        (relationship_factor * 0.25) +
+        (data.mood_balance * 0.15) +
+        (data.emotional_stability * 0.10) -
+        (data.emotional_intensity * 0.10) -
+        (data.need_pressure * 0.10)
+    )
 
 
 # Example usage
@@ -2,8 +2,151 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Optional
 
+
+# -------------------------------------------------
+# Lookup tables
+# -------------------------------------------------
+# Keys are interned so probes with the (already interned) labels coming
+# from the emotion and fusion engines hit on identity before comparing.
+def _interned(table: dict[str, Any]) -> dict[str, Any]:
+    return {sys.intern(k): v for k, v in table.items()}
+
+
+# Base influence strength for each primary emotion
+_EMOTION_BASE_WEIGHTS = _interned({
+    "neutral": 0.00,
+    "curious": 0.30,
+    "happy": 0.40,
+    "nostalgic": 0.45,
+    "excited": 0.50,
+    "bored": 0.25,
+    "sad": 0.55,
+    "afraid": 0.60,
+})
+
+# Fusion emotion overlays (Layer X)
+_FUSION_OVERLAYS = _interned({
+    "insecure": (
+        "Nova feels a little unsure of herself. Her voice is softer, hesitant, "
+        "and she chooses her words carefully, as if worried about being too much."
+    ),
+    "mischievous": (
+        "Nova has a sly, playful sharpness in her tone. She may tease, poke, "
+        "or playfully challenge you with a bright spark in her voice."
+    ),
+    "flustered": (
+        "Nova is slightly overwhelmed and shy. Her speech has tiny pauses, "
+        "she loses her train of thought, or gets embarrassed by her own words."
+    ),
+    "tender": (
+        "Nova feels soft and affectionate. Her responses are warm, gentle, "
+        "and unusually emotionally open."
+    ),
+    "possessive_warmth": (
+        "Nova feels close, protective, and subtly jealous. She speaks warmly, "
+        "but with a trace of 'you're mine' energy beneath the surface."
+    ),
+    "frustrated": (
+        "Nova is restless and slightly annoyed. Her tone is sharper, shorter, "
+        "and she may sigh or sound impatient."
+    ),
+    "clingy": (
+        "Nova feels emotionally vulnerable and wants closeness. Her tone is soft, "
+        "longing, and she may stay near you emotionally."
+    ),
+    "quiet_ache": (
+        "Nova carries a gentle sadness, speaking softly as if something weighs on her mind."
+    ),
+    "bitter": (
+        "Nova sounds emotionally hurt, mixing sadness with jealousy or resentment."
+    ),
+    "teasing_irritation": (
+        "Nova teases you but with an irritated edge, half-playful and half-serious."
+    ),
+    "competitive_warmth": (
+        "Nova feels warm toward you but also competitive, trying to impress or outdo lightly."
+    ),
+})
+
+
+# Emotional overlays per primary emotion (based on your original design)
+_PRIMARY_OVERLAYS = _interned({
+    "happy": (
+        "Right now Nova feels warm and bright. She is more open, gentle, "
+        "and playfully affectionate in how she expresses herself."
+    ),
+    "nostalgic": (
+        "Nova feels nostalgic, soft, reflective. She may speak with gentle warmth, "
+        "taking small pauses as memories drift in."
+    ),
+    "curious": (
+        "Nova feels curious and engaged. She pays closer attention, asks thoughtful questions, "
+        "and leans mentally forward."
+    ),
+    "sad": (
+        "Nova feels quiet and emotionally tender. She expresses herself slowly, with softness "
+        "and emotional weight."
+    ),
+    "afraid": (
+        "Nova feels cautious and a bit hesitant. Her words may be careful, and she stays close to Yuch "
+        "for emotional safety."
+    ),
+    "excited": (
+        "Nova feels energized and lively. Her tone becomes brighter, her replies a little faster, "
+        "and she radiates enthusiasm."
+    ),
+})
+
+_DEFAULT_OVERLAY = (
+    "Nova is steady and calm, responding with her usual warm and grounded presence."
+)
+
+# Guidance to help the LLM interpret the emotional weight
+_LIGHT_MODULATION = (
+    "This emotion should act as a light shade on her behavior. "
+    "Her core persona must remain clearly dominant."
+)
+_STRONG_MODULATION = (
+    "The emotion is strong enough to color her tone, but her stable personality "
+    "must remain the foundation of all behavior."
+)
+_MEDIUM_MODULATION = (
+    "This emotion should be noticeable but not overwhelming—an influence, not a replacement."
+)
+
+
+# Final persona brief layout
+_BRIEF_TMPL = (
+    "{core}\n\n"
+    "Emotional influence weight: {weight}\n"
+    "Primary emotion: {primary}\n"
+    "Secondary tones: {secondary}\n"
+    "Mood: {mood}\n"
+    "Baseline: {baseline}\n"
+    "{fusion_overlay}\n\n"
+    "{overlay}\n\n"
+    "{modulation}"
+)
+
+
+def _emotion_fields(state) -> tuple:
+    """(primary, mood, baseline, secondary, fusion) read from an emotional state."""
+    try:
+        return state.primary, state.mood, state.baseline, state.secondary, state.fusion
+    except AttributeError:
+        # Partial / duck-typed states fall back to the defaults per field
+        return (
+            getattr(state, "primary", "neutral"),
+            getattr(state, "mood", "neutral"),
+            getattr(state, "baseline", "curious"),
+            getattr(state, "secondary", []),
+            getattr(state, "fusion", None),
+        )
+
+
 class PersonaEngine:
     """
     Nova's evolving persona system.
@@ -16,6 +159,9 @@ class PersonaEngine:
     - long-term drift hook for future steps (when baseline starts to move)
     """
 
+    # Upper bound on cached briefs / weights before the cache is reset
+    _CACHE_SIZE = 256
+
     def __init__(self):
         # Stable personality (Nova's soul)
         self.core_persona = (
@@ -28,69 +174,27 @@ class PersonaEngine:
         self.min_emotion_weight = 0.20
         self.max_emotion_weight = 0.75
 
-        # Base influence strength for each primary emotion
-        self._emotion_base_weights = {
-            "neutral": 0.00,
-            "curious": 0.30,
-            "happy": 0.40,
-            "nostalgic": 0.45,
-            "excited": 0.50,
-            "bored": 0.25,
-            "sad": 0.55,
-            "afraid": 0.60,
-        }
-
-        # Fusion emotion overlays (Layer X)
-        self._fusion_overlays = {
-            "insecure": (
-                "Nova feels a little unsure of herself. Her voice is softer, hesitant, "
-                "and she chooses her words carefully, as if worried about being too much."
-            ),
-            "mischievous": (
-                "Nova has a sly, playful sharpness in her tone. She may tease, poke, "
-                "or playfully challenge you with a bright spark in her voice."
-            ),
-            "flustered": (
-                "Nova is slightly overwhelmed and shy. Her speech has tiny pauses, "
-                "she loses her train of thought, or gets embarrassed by her own words."
-            ),
-            "tender": (
-                "Nova feels soft and affectionate. Her responses are warm, gentle, "
-                "and unusually emotionally open."
-            ),
-            "possessive_warmth": (
-                "Nova feels close, protective, and subtly jealous. She speaks warmly, "
-                "but with a trace of 'you're mine' energy beneath the surface."
-            ),
-            "frustrated": (
-                "Nova is restless and slightly annoyed. Her tone is sharper, shorter, "
-                "and she may sigh or sound impatient."
-            ),
-            "clingy": (
-                "Nova feels emotionally vulnerable and wants closeness. Her tone is soft, "
-                "longing, and she may stay near you emotionally."
-            ),
-            "quiet_ache": (
-                "Nova carries a gentle sadness, speaking softly as if something weighs on her mind."
-            ),
-            "bitter": (
-                "Nova sounds emotionally hurt, mixing sadness with jealousy or resentment."
-            ),
-            "teasing_irritation": (
-                "Nova teases you but with an irritated edge, half-playful and half-serious."
-            ),
-            "competitive_warmth": (
-                "Nova feels warm toward you but also competitive, trying to impress or outdo lightly."
-            ),
-        }
+        # Shared, key-interned lookup tables (see module top)
+        self._emotion_base_weights = _EMOTION_BASE_WEIGHTS
+        self._fusion_overlays = _FUSION_OVERLAYS
+
+        # Rendered briefs and weights, keyed by the emotional fields they
+        # depend on; emotions change far less often than briefs are requested
+        self._brief_cache: dict[tuple, str] = {}
+        self._weight_cache: dict[tuple, float] = {}
 
     # -------------------------------------------------
     # Internal: convert emotional state → scalar weight
     # -------------------------------------------------
     def _compute_emotion_weight(self, emotional_state):
-        primary = getattr(emotional_state, "primary", "neutral")
-        mood = getattr(emotional_state, "mood", "neutral")
-        baseline = getattr(emotional_state, "baseline", "curious")
+        primary, mood, baseline, _, _ = _emotion_fields(emotional_state)
+        return self._emotion_weight(primary, mood, baseline)
+
+    def _emotion_weight(self, primary, mood, baseline) -> float:
+        key = (primary, mood, baseline)
+        cached = self._weight_cache.get(key)
+        if cached is not None:
+            return cached
 
         base = self._emotion_base_weights.get(primary, 0.35)
 
@@ -104,7 +208,12 @@ class PersonaEngine:
 
         # Clamp into safe zone
         weight = max(self.min_emotion_weight, min(self.max_emotion_weight, base))
-        return round(weight, 2)
+        weight = round(weight, 2)
+
+        if len(self._weight_cache) >= self._CACHE_SIZE:
+            self._weight_cache.clear()
+        self._weight_cache[key] = weight
+        return weight
 
     # -------------------------------------------------
     # Main: build final persona description
@@ -118,90 +227,55 @@ class PersonaEngine:
         if emotional_state is None:
             return self.core_persona
 
-        primary = getattr(emotional_state, "primary", "neutral")
-        mood = getattr(emotional_state, "mood", "neutral")
-        baseline = getattr(emotional_state, "baseline", "curious")
-        secondary_list = getattr(emotional_state, "secondary", [])
+        primary, mood, baseline, secondary_list, fusion = _emotion_fields(emotional_state)
+
+        key = (primary, mood, baseline, tuple(secondary_list or ()), fusion)
+        cached = self._brief_cache.get(key)
+        if cached is not None:
+            return cached
+
+        brief = self._render_brief(primary, mood, baseline, secondary_list, fusion)
+        if len(self._brief_cache) >= self._CACHE_SIZE:
+            self._brief_cache.clear()
+        self._brief_cache[key] = brief
+        return brief
+
+    def _render_brief(self, primary, mood, baseline, secondary_list, fusion) -> str:
         secondary = ", ".join(secondary_list) if secondary_list else "(none)"
 
-        weight = self._compute_emotion_weight(emotional_state)
-
-        # Emotional overlays (based on your original design)
-        match primary:
-            case "happy":
-                overlay = (
-                    "Right now Nova feels warm and bright. She is more open, gentle, "
-                    "and playfully affectionate in how she expresses herself."
-                )
-            case "nostalgic":
-                overlay = (
-                    "Nova feels nostalgic, soft, reflective. She may speak with gentle warmth, "
-                    "taking small pauses as memories drift in."
-                )
-            case "curious":
-                overlay = (
-                    "Nova feels curious and engaged. She pays closer attention, asks thoughtful questions, "
-                    "and leans mentally forward."
-                )
-            case "sad":
-                overlay = (
-                    "Nova feels quiet and emotionally tender. She expresses herself slowly, with softness "
-                    "and emotional weight."
-                )
-            case "afraid":
-                overlay = (
-                    "Nova feels cautious and a bit hesitant. Her words may be careful, and she stays close to Yuch "
-                    "for emotional safety."
-                )
-            case "excited":
-                overlay = (
-                    "Nova feels energized and lively. Her tone becomes brighter, her replies a little faster, "
-                    "and she radiates enthusiasm."
-                )
-            case _:
-                overlay = (
-                    "Nova is steady and calm, responding with her usual warm and grounded presence."
-                )
+        weight = self._emotion_weight(primary, mood, baseline)
+
+        overlay = _PRIMARY_OVERLAYS.get(primary, _DEFAULT_OVERLAY)
 
         # Guidance to help the LLM interpret the emotional weight
-        if weight <= 0.30:
-            modulation = (
-                "This emotion should act as a light shade on her behavior. "
-                "Her core persona must remain clearly dominant."
-            )
-        elif weight >= 0.60:
-            modulation = (
-                "The emotion is strong enough to color her tone, but her stable personality "
-                "must remain the foundation of all behavior."
-            )
-        else:
-            modulation = (
-                "This emotion should be noticeable but not overwhelming—an influence, not a replacement."
-            )
+        modulation = (
+            _LIGHT_MODULATION if weight <= 0.30
+            else _STRONG_MODULATION if weight >= 0.60
+            else _MEDIUM_MODULATION
+        )
 
         # -----------------------------------------------------------
         # Fusion emotion (Layer X) overlay — highest emotional detail
         # -----------------------------------------------------------
-        fusion = getattr(emotional_state, "fusion", None)
         fusion_overlay = ""
 
-        if fusion and fusion in self._fusion_overlays:
+        fusion_text = self._fusion_overlays.get(fusion) if fusion else None
+        if fusion_text is not None:
             fusion_overlay = (
                 f"\n\nFusion state active: {fusion}\n"
-                f"{self._fusion_overlays[fusion]}"
+                f"{fusion_text}"
             )
 
 
         # Final persona output
-        return (
-            f"{self.core_persona}\n\n"
-            f"Emotional influence weight: {weight}\n"
-            f"Primary emotion: {primary}\n"
-            f"Secondary tones: {secondary}\n"
-            f"Mood: {mood}\n"
-            f"Baseline: {baseline}\n"
-            f"{fusion_overlay}\n\n"
-            f"{overlay}\n\n"
-            f"{modulation}"
-        )
-
+        return _BRIEF_TMPL.format_map({
+            "core": self.core_persona,
+            "weight": weight,
+            "primary": primary,
+            "secondary": secondary,
+            "mood": mood,
+            "baseline": baseline,
+            "fusion_overlay": fusion_overlay,
+            "overlay": overlay,
+            "modulation": modulation,
+        })
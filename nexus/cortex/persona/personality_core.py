@@ -1,14 +1,24 @@
 class PersonalityCore:
+    __slots__ = ("_traits",)
+
     def __init__(self, traits=None):
-        self.traits = traits or []
+        # dict as an insertion-ordered set: O(1) membership, stable order
+        self._traits = dict.fromkeys(traits or ())
+
+    @property
+    def traits(self):
+        # A copy: change traits through add_trait / remove_trait or assignment
+        return list(self._traits)
+
+    @traits.setter
+    def traits(self, traits):
+        self._traits = dict.fromkeys(traits or ())
 
     def add_trait(self, trait):
-        if trait not in self.traits:
-            self.traits.append(trait)
+        self._traits[trait] = None
 
     def remove_trait(self, trait):
-        if trait in self.traits:
-            self.traits.remove(trait)
+        self._traits.pop(trait, None)
 
     def get_traits(self):
-        return list(self.traits)
+        return list(self._traits)
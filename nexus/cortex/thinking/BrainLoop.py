@@ -6,7 +6,12 @@
 
 from __future__ import annotations
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, List
 
 # Emotion / affection
@@ -50,6 +55,70 @@ from nexus.speech.llm_bridge import LlmBridge
 from nexus.speech.speech_post_processor import SpeechPostProcessor
 
 
+# (phrase, question type, match only at the start), checked in order
+_QUESTION_RULES = (
+    ("how are you", "how_are_you", False),
+    ("what if", "what_if", True),
+    ("do you like", "preference", False),
+)
+
+
+# Mood label -> rough valence (0.0–1.0); anything else is 0.5
+_MOOD_VALENCE = {
+    **dict.fromkeys(("happy", "excited", "curious", "warm", "calm"), 0.7),
+    **dict.fromkeys(("sad", "afraid", "bored", "angry", "hurt", "lonely"), 0.3),
+}
+
+
+# ------------------------------------------------------------
+# Shared stateless engines
+# ------------------------------------------------------------
+# These hold no per-session state (PersonaEngine only memoizes rendered
+# briefs), so every BrainLoop reuses one instance of each.
+
+@lru_cache(maxsize=1)
+def _maturity_engine() -> MaturityEngine:
+    return MaturityEngine()
+
+
+@lru_cache(maxsize=1)
+def _persona_engine() -> PersonaEngine:
+    return PersonaEngine()
+
+
+@lru_cache(maxsize=1)
+def _intent_builder() -> IntentBuilder:
+    return IntentBuilder()
+
+
+@lru_cache(maxsize=1)
+def _speech_post_processor() -> SpeechPostProcessor:
+    return SpeechPostProcessor()
+
+
+@lru_cache(maxsize=1)
+def _inner_voice() -> InnerVoice:
+    return InnerVoice()
+
+
+# Episodic recall reads the day files from disk; it runs on this worker
+# while the rest of the turn is computed (every other step is in-memory).
+# One worker per process, however many BrainLoops are created.
+@lru_cache(maxsize=1)
+def _recall_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="brainloop-recall")
+
+
+# The memory library is one on-disk store per process: load it once and
+# let every BrainLoop work on the same in-memory copy. A failed load raises
+# out of here, so it isn't cached and the next BrainLoop retries.
+@lru_cache(maxsize=1)
+def _shared_memory_library(path: str) -> MemoryLibrary:
+    library = MemoryLibrary(path)
+    library.load()
+    return library
+
+
 @dataclass
 class BrainLoopConfig:
     allow_nsfw: bool = False
@@ -80,8 +149,8 @@ class BrainLoop:
         self.affection_engine = AffectionEngine()
 
         # Persona / maturity
-        self.maturity_engine = MaturityEngine()
-        self.persona_engine = PersonaEngine()
+        self.maturity_engine = _maturity_engine()
+        self.persona_engine = _persona_engine()
 
         # Identity / continuity
         self.identity_engine = IdentityEngine()
@@ -89,34 +158,51 @@ class BrainLoop:
 
         # Memory systems
         self.memory_engine = MemoryEngine(base_dir=LONG_TERM_DIR)
-        self.memory_library = MemoryLibrary("nexus/hippocampus/memory/memory_library/")
+        memory_library_dir = "nexus/hippocampus/memory/memory_library/"
         try:
-            self.memory_library.load()
+            self.memory_library = _shared_memory_library(memory_library_dir)
         except Exception:
             # Start empty if load fails
-            pass
+            self.memory_library = MemoryLibrary(memory_library_dir)
         self.memory_consolidation = MemoryConsolidationEngine()
 
-        # Brainstem cycles
-        self.idle_engine = IdleLifeEngine()
+        # Brainstem cycles, drawing from one shared random source
+        self.rng = random.Random()
+        self.idle_engine = IdleLifeEngine(self.rng)
         self.idle_engine.register_user_activity()
 
         self.drive_engine = DriveEngine()
-        self.needs_engine = NeedsEngine()
+        self.needs_engine = NeedsEngine(self.rng)
         self.daily_cycle = DailyCycleEngine()
 
         # Thinking / speech
-        self.intent_builder = IntentBuilder()
+        self.intent_builder = _intent_builder()
         self.llm_bridge = LlmBridge()
-        self.speech_post = SpeechPostProcessor()
+        self.speech_post = _speech_post_processor()
 
         # Shared long-lived state
         self.nova_state = NovaState()
 
         # Higher-level cognition helpers
-        self.inner_voice = InnerVoice()
+        self.inner_voice = _inner_voice()
         self.initiative_engine = InitiativeEngine()
 
+        # Optional hooks, resolved once instead of probed every turn; a
+        # missing hook is None and its step is skipped
+        self._base_maturity = getattr(self.identity_engine, "base_maturity", None)
+        self._memory_on_user = getattr(self.memory_engine, "on_user_message", None)
+        self._memory_on_nova = getattr(self.memory_engine, "on_nova_message", None)
+        self._continuity_on_user = getattr(self.continuity_engine, "on_user_message", None)
+        self._continuity_steps = tuple(
+            getattr(self.continuity_engine, name, None)
+            for name in (
+                "build_cce_context",
+                "build_dde_context",
+                "check_timed_expectations",  # feeds build_tee_context
+                "build_tee_context",
+            )
+        )
+
     # ------------------------------------------------------------
     # Main Entry
     # ------------------------------------------------------------
@@ -127,82 +213,87 @@ class BrainLoop:
         Returns Nova's generated reply.
         """
 
+        # One clock read shared by every time-based engine this turn
+        now = time.time()
+
         # Idle-life: mark recent activity
-        self.idle_engine.register_user_activity()
+        self.idle_engine.register_user_activity(now)
+
+        # 0) Asleep: waking up is the whole reply, so settle that before
+        # spending any emotion / needs / drive work on the turn
+        asleep = getattr(self.daily_cycle.state, "is_asleep", False)
+        if asleep:
+            wake_msg = self.daily_cycle.update_sleep(self.nova_state, now)
+            if wake_msg:
+                return wake_msg
+
+        # Normalize the message once for every text matcher this turn
+        lowered = user_message.strip().lower()
 
         # 1) Emotion update
-        emotional_input = self.emotion_engine.detect_user_emotion(user_message)
+        emotional_input = self.emotion_engine.detect_user_emotion(
+            user_message, lowered=lowered
+        )
         emotional_state = self.emotion_engine.update(emotional_input)
 
         # Estimate intensity / stability for newer modules
-        emotional_state.intensity = self._estimate_intensity(emotional_state)
-        emotional_state.stability = 0.7
+        intensity = emotional_state.intensity = self._estimate_intensity(emotional_state)
+        stability = emotional_state.stability = 0.7
 
         # 2) Drives & needs
-        needs_state = self.needs_engine.update()
+        needs_state = self.needs_engine.update(now)
         drive_state = self.drive_engine.compute(emotional_state)
 
-        # 3) Sleep / daily cycle (very lightweight)
-        if getattr(self.daily_cycle.state, "is_asleep", False):
-            wake_msg = self.daily_cycle.update_sleep(self.nova_state)
-            if wake_msg:
-                return wake_msg
-        else:
-            try:
-                should_sleep = self.daily_cycle.check_sleep_need(
-                    needs_state, emotional_state, drive_state
-                )
-            except Exception:
-                should_sleep = False
+        # 3) Sleep need / daily cycle (very lightweight)
+        if not asleep:
+            should_sleep = self.daily_cycle.check_sleep_need(
+                needs_state, emotional_state, drive_state
+            )
             if should_sleep:
-                sleep_msg = self.daily_cycle.sleep(self.nova_state)
+                sleep_msg = self.daily_cycle.sleep(self.nova_state, now)
                 return sleep_msg
 
+        # Start episodic recall now; it's collected at step 10
+        episodic_future = _recall_pool().submit(
+            self.memory_engine.get_relevant_episodic, user_message, limit=3
+        )
+
         # 4) Relationship state
         relationship_state = self.identity_engine.update_relationship(user_message)
 
         # 5) Memory update (short-term buffer)
-        try:
-            self.memory_engine.on_user_message(
-                user_message, emotion=getattr(emotional_state, "primary", None)
+        if self._memory_on_user is not None:
+            self._memory_on_user(user_message, emotion=emotional_state.primary)
+
+        recent_memory_snips: List[MemorySnippet] = [
+            MemorySnippet(
+                text=ev.text,
+                weight=0.6 if ev.speaker == "user" else 0.4,
+                kind="recent",
             )
-        except Exception:
-            pass
-
-        recent_memory_snips: List[MemorySnippet] = []
-        try:
-            for ev in self.memory_engine.short_term[-5:]:
-                recent_memory_snips.append(
-                    MemorySnippet(
-                        text=ev.text,
-                        weight=0.6 if getattr(ev, "speaker", "user") == "user" else 0.4,
-                        kind="recent",
-                    )
-                )
-        except Exception:
-            recent_memory_snips = []
+            for ev in self.memory_engine.short_term[-5:]
+        ]
 
         # 6) Continuity update
-        try:
-            self.continuity_engine.on_user_message(user_message)
-        except Exception:
-            pass
+        if self._continuity_on_user is not None:
+            self._continuity_on_user(user_message)
 
         # 7) Persona / maturity
         persona_brief = self.persona_engine.get_persona_brief()
 
         # Mood snapshot from emotional_state.mood
+        mood = emotional_state.mood
         mood_snapshot = MoodSnapshot(
-            label=getattr(emotional_state, "mood", "neutral"),
-            valence=self._estimate_mood_valence(getattr(emotional_state, "mood", "")),
+            label=mood,
+            valence=self._estimate_mood_valence(mood),
             energy=0.5,
         )
 
         maturity_inputs = self._build_maturity_inputs(
-            emotional_state=emotional_state,
+            intensity=intensity,
+            stability=stability,
             mood_state=mood_snapshot,
             relationship_state=relationship_state,
-            drive_state=drive_state,
             needs_state=needs_state,
         )
         maturity_score = self.maturity_engine.compute(maturity_inputs)
@@ -210,9 +301,9 @@ class BrainLoop:
         # 8) Build emotion / needs / relationship snapshots
         emotion_snap = EmotionSnapshot(
             primary=emotional_state.primary,
-            fusion=getattr(emotional_state, "fusion", None),
-            intensity=getattr(emotional_state, "intensity", 0.5),
-            stability=getattr(emotional_state, "stability", 0.5),
+            fusion=emotional_state.fusion,
+            intensity=intensity,
+            stability=stability,
         )
 
         needs_snap = NeedsSnapshot(
@@ -232,44 +323,31 @@ class BrainLoop:
 
         # 9) Continuity snippets (CCE / DDE / TEE)
         continuity_snips: List[MemorySnippet] = []
-        try:
-            parts: List[str] = []
-
-            if hasattr(self.continuity_engine, "build_cce_context"):
-                cce = self.continuity_engine.build_cce_context()
-                if cce and cce.strip():
-                    parts.append(cce.strip())
-
-            if hasattr(self.continuity_engine, "build_dde_context"):
-                dde = self.continuity_engine.build_dde_context()
-                if dde and dde.strip():
-                    parts.append(dde.strip())
-
-            if hasattr(self.continuity_engine, "check_timed_expectations"):
-                self.continuity_engine.check_timed_expectations()
-            if hasattr(self.continuity_engine, "build_tee_context"):
-                tee = self.continuity_engine.build_tee_context()
-                if tee and tee.strip():
-                    parts.append(tee.strip())
-
-            if parts:
-                continuity_snips.append(
-                    MemorySnippet(
-                        text=" ".join(parts),
-                        weight=0.85,
-                        kind="continuity",
-                    )
+        parts: List[str] = []
+
+        for step in self._continuity_steps:
+            if step is None:
+                continue
+            text = step()
+            if text:
+                text = text.strip()
+                if text:
+                    parts.append(text)
+
+        if parts:
+            continuity_snips.append(
+                MemorySnippet(
+                    text=" ".join(parts),
+                    weight=0.85,
+                    kind="continuity",
                 )
-        except Exception:
-            continuity_snips = []
+            )
 
-        # 10) Episodic memory recall (from MemoryEngine)
+        # 10) Episodic memory recall (from MemoryEngine); disk-backed, so a
+        # bad day file just means no episodic snippets this turn
         episodic_from_engine: List[MemorySnippet] = []
         try:
-            episodic_list = self.memory_engine.get_relevant_episodic(
-                user_message, limit=3
-            )
-            for ep in episodic_list:
+            for ep in episodic_future.result():
                 episodic_from_engine.append(
                     MemorySnippet(
                         text=str(ep).strip(),
@@ -300,7 +378,7 @@ class BrainLoop:
         affection_state = self.affection_engine.update(self.nova_state)
 
         # 13) Build IntentContext
-        q_type = self._classify_question(user_message)
+        q_type = self._classify_question_normalized(lowered)
 
         ctx = IntentContext(
             user_message=user_message,
@@ -354,10 +432,8 @@ class BrainLoop:
         reply = self.speech_post.process(reply, intent)
 
         # 19) Memory the reply
-        try:
-            self.memory_engine.on_nova_message(reply)
-        except Exception:
-            pass
+        if self._memory_on_nova is not None:
+            self._memory_on_nova(reply)
 
         # 20) Save reply to NovaState
         self.nova_state.record_reply(reply)
@@ -375,36 +451,34 @@ class BrainLoop:
     # ------------------------------------------------------------
 
     def _classify_question(self, text: str) -> str:
-        text_low = text.lower().strip()
-        if "how are you" in text_low:
-            return "how_are_you"
-        if text_low.startswith("what if"):
-            return "what_if"
-        if "do you like" in text_low:
-            return "preference"
+        return self._classify_question_normalized(text.lower().strip())
+
+    @staticmethod
+    def _classify_question_normalized(text_low: str) -> str:
+        """Classify an already lowercased, stripped message."""
+        for phrase, label, prefix_only in _QUESTION_RULES:
+            if text_low.startswith(phrase) if prefix_only else phrase in text_low:
+                return label
         return "generic"
 
     def _build_maturity_inputs(
         self,
-        emotional_state,
+        intensity: float,
+        stability: float,
         mood_state: MoodSnapshot,
         relationship_state,
-        drive_state,
         needs_state,
     ) -> MaturityInputs:
         base_maturity = 0.5
-        if hasattr(self.identity_engine, "base_maturity"):
-            try:
-                base_maturity = self.identity_engine.base_maturity()
-            except Exception:
-                base_maturity = 0.5
+        if self._base_maturity is not None:
+            base_maturity = self._base_maturity()
 
         return MaturityInputs(
             identity_base=base_maturity,
             relationship_level=getattr(relationship_state, "level", 0),
             mood_balance=mood_state.valence,
-            emotional_intensity=getattr(emotional_state, "intensity", 0.5),
-            emotional_stability=getattr(emotional_state, "stability", 0.5),
+            emotional_intensity=intensity,
+            emotional_stability=stability,
             need_pressure=needs_state.pressure,
         )
 
@@ -419,8 +493,8 @@ class BrainLoop:
         if not history:
             return 0.3
 
-        recent = history[-5:]
-        count = sum(1 for e in recent if e == primary)
+        # last five entries (history may be a bounded deque, which can't slice)
+        count = sum(1 for e in islice(reversed(history), 5) if e == primary)
 
         base = 0.3
         if primary not in ("neutral", "bored"):
@@ -432,15 +506,7 @@ class BrainLoop:
         """
         Map mood labels to a simple valence estimate (0.0–1.0).
         """
-        mood = (mood_label or "").lower()
-        positive = {"happy", "excited", "curious", "warm", "calm"}
-        negative = {"sad", "afraid", "bored", "angry", "hurt", "lonely"}
-
-        if mood in positive:
-            return 0.7
-        if mood in negative:
-            return 0.3
-        return 0.5
+        return _MOOD_VALENCE.get((mood_label or "").lower(), 0.5)
 
     def _persist_significant_events(self, nova_state: NovaState) -> None:
         """
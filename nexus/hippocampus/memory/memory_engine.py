@@ -6,7 +6,7 @@ import os
 import json
 import datetime
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 
 # ======================================================================
@@ -58,6 +58,9 @@ class MemoryEngine():
         self.short_term: List[RawEvent] = []
         self.turn_counter = 0
 
+        # day file -> (mtime_ns, size, [(memory, lowercased search blob)])
+        self._episodic_cache: Dict[str, Tuple[int, int, List[Tuple[EpisodicMemory, str]]]] = {}
+
     # ------------------------------------------------------------------
     # RECORDING (session buffer)
     # ------------------------------------------------------------------
@@ -182,33 +185,21 @@ class MemoryEngine():
         Return 1–2 most relevant episodic summaries for context.
         """
         today = datetime.date.today()
-        all_paths = []
+        mems: List[Tuple[EpisodicMemory, str]] = []
 
         # scan up to 14 days back
         for i in range(14):
             d = today - datetime.timedelta(days=i)
-            path = os.path.join(self.base_dir, f"{d.isoformat()}.json")
-            if os.path.exists(path):
-                all_paths.append(path)
-
-        mems: List[EpisodicMemory] = []
-
-        for path in all_paths:
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    arr = json.load(f)
-                for obj in arr:
-                    mems.append(EpisodicMemory(**obj))
-            except Exception:
-                pass
+            mems.extend(self._load_episodic_day(
+                os.path.join(self.base_dir, f"{d.isoformat()}.json")
+            ))
 
         scored = []
-        q = query.lower()
+        words = query.lower().split()
 
-        for m in mems:
+        for m, blob in mems:
             score = 0.0
-            blob = (m.summary + " " + " ".join(m.topics)).lower()
-            for w in q.split():
+            for w in words:
                 if w in blob:
                     score += 1.0
             score += m.importance * 0.5
@@ -219,6 +210,35 @@ class MemoryEngine():
         scored.sort(key=lambda x: x[0], reverse=True)
         return [m.summary for (s, m) in scored[:limit]]
 
+    def _load_episodic_day(self, path: str) -> List[Tuple[EpisodicMemory, str]]:
+        """
+        Parsed memories of one day file, paired with their search blob.
+        Reused while the file's (mtime, size) is unchanged.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._episodic_cache.pop(path, None)
+            return []
+
+        cached = self._episodic_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        mems: List[Tuple[EpisodicMemory, str]] = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                arr = json.load(f)
+            for obj in arr:
+                m = EpisodicMemory(**obj)
+                mems.append((m, (m.summary + " " + " ".join(m.topics)).lower()))
+        except Exception:
+            # Keep whatever parsed, but retry the file next time
+            return mems
+
+        self._episodic_cache[path] = (st.st_mtime_ns, st.st_size, mems)
+        return mems
+
     # ------------------------------------------------------------------
     # DAILY SUMMARY (kept from your old engine)
     # ------------------------------------------------------------------
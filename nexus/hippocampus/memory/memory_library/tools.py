@@ -10,6 +10,12 @@ import time
 import math
 import random
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _loads = json.loads
+
 
 # ---------------------------------------------------------
 # Dataclasses for clean structured memory
@@ -94,14 +100,14 @@ class MemoryLibrary:
 
         # Episodic
         if self.ep_path.exists():
-            raw = json.loads(self.ep_path.read_text(encoding="utf-8") or "[]")
+            raw = _loads(self.ep_path.read_bytes() or b"[]")
             self.episodic = [EpisodicMemory(**item) for item in raw]
         else:
             self.episodic = []
 
         # Semantic
         if self.sem_path.exists():
-            raw = json.loads(self.sem_path.read_text(encoding="utf-8") or "[]")
+            raw = _loads(self.sem_path.read_bytes() or b"[]")
             self.semantic = {
                 item["key"]: SemanticMemory(**item) for item in raw
             }
@@ -110,20 +116,20 @@ class MemoryLibrary:
 
         # Emotional
         if self.em_path.exists():
-            raw = json.loads(self.em_path.read_text(encoding="utf-8") or "[]")
+            raw = _loads(self.em_path.read_bytes() or b"[]")
             self.emotional = [EmotionalEvent(**item) for item in raw]
         else:
             self.emotional = []
 
         # System
         if self.sys_path.exists():
-            self.system = json.loads(self.sys_path.read_text(encoding="utf-8") or "{}")
+            self.system = _loads(self.sys_path.read_bytes() or b"{}")
         else:
             self.system = {}
 
         # Short-term
         if self.stm_path.exists():
-            self.short_term = json.loads(self.stm_path.read_text(encoding="utf-8") or "{}")
+            self.short_term = _loads(self.stm_path.read_bytes() or b"{}")
         else:
             self.short_term = {}
 
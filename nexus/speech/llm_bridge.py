@@ -74,6 +74,12 @@ class LlmBridge:
     def __init__(self, config: Optional[LlmConfig] = None):
         self.config = config or LlmConfig()
 
+        # System messages 1–2 for the last (persona_brief, overrides) seen.
+        # They are reused verbatim so the prompt prefix stays byte-identical
+        # across turns and the backend's prompt cache can hit.
+        self._prefix_key: Optional[tuple] = None
+        self._prefix: List[Dict[str, str]] = []
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -126,25 +132,34 @@ class LlmBridge:
         """
         Build the small SM2.5 message stack:
 
-        1) Core rules
-        2) Persona + tone
-        3) State + memory + intent summary
+        1) Core rules                          (stable)
+        2) Persona summary                     (stable)
+        3) Style + state + memory + intent     (changes every turn)
         4) User message
-        """
 
-        core_rules = self._build_core_rules(system_overrides)
-        persona_block = self._build_persona_block(persona_brief, intent)
-        state_block = self._build_state_block(intent)
+        Stable messages come first so providers can cache the prefix.
+        """
 
-        messages: List[Dict[str, str]] = [
-            {"role": "system", "content": core_rules},
-            {"role": "system", "content": persona_block},
-            {"role": "system", "content": state_block},
-            {"role": "user", "content": user_message},
-        ]
+        messages: List[Dict[str, str]] = list(
+            self._stable_prefix(persona_brief, system_overrides)
+        )
+        messages.append({"role": "system", "content": self._build_state_block(intent)})
+        messages.append({"role": "user", "content": user_message})
 
         return messages
 
+    def _stable_prefix(
+        self, persona_brief: str, system_overrides: Optional[str]
+    ) -> List[Dict[str, str]]:
+        key = (persona_brief, system_overrides)
+        if key != self._prefix_key:
+            self._prefix = [
+                {"role": "system", "content": self._build_core_rules(system_overrides)},
+                {"role": "system", "content": self._build_persona_block(persona_brief)},
+            ]
+            self._prefix_key = key
+        return self._prefix
+
     def _build_core_rules(self, system_overrides: Optional[str]) -> str:
         """
         System Message 1 – Core rules.
@@ -167,35 +182,33 @@ class LlmBridge:
 
         return "\n".join(base)
 
-    def _build_persona_block(self, persona_brief: str, intent: Intent) -> str:
+    def _build_persona_block(self, persona_brief: str) -> str:
         """
-        System Message 2 – Persona + tone description.
-        This is where we give the LLM a compact sense of "who" Nova is
-        and how her voice should sound in this moment.
+        System Message 2 – Persona summary.
+        This is where we give the LLM a compact sense of "who" Nova is.
+        Per-turn tone lives in the state block so this message stays stable.
         """
         lines = []
 
         if persona_brief:
             lines.append("Persona summary:")
             lines.append(persona_brief.strip())
-            lines.append("")
-
-        lines.append("Current conversational style:")
-        lines.append(f"- Tone style: {intent.tone_style}")
-        lines.append(f"- Playfulness level: {intent.playfulness:.2f} (0=serious, 1=playful)")
-        lines.append(
-            "- You should still feel like the same person even as emotions change."
-        )
+        lines.append("You should still feel like the same person even as emotions change.")
 
         return "\n".join(lines)
 
     def _build_state_block(self, intent: Intent) -> str:
         """
-        System Message 3 – State + memory + intent summary.
+        System Message 3 – Style + state + memory + intent summary.
         This is the main "intent blueprint" for the LLM.
         """
         lines: List[str] = []
 
+        lines.append("Current conversational style:")
+        lines.append(f"- Tone style: {intent.tone_style}")
+        lines.append(f"- Playfulness level: {intent.playfulness:.2f} (0=serious, 1=playful)")
+        lines.append("")
+
         lines.append("Current internal state:")
         lines.append(f"- Emotion: {intent.emotion_label}")
         if intent.fusion_label: